@@ -0,0 +1,20 @@
+"""Application settings, loaded from the environment with a FLOT_ prefix."""
+
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="FLOT_", env_file=".env", extra="ignore")
+
+    data_dir: Path = Path("data")
+    database_url: str = "sqlite+aiosqlite:///data/flot.db"
+    anthropic_api_key: str = ""
+    vision_model: str = "claude-sonnet-4-20250514"
+    frame_interval: float = 1.0
+    vision_concurrency: int = 4
+    vision_batch_size: int = 4
+
+
+settings = Settings()
@@ -0,0 +1,42 @@
+"""Async SQLAlchemy engine, session factory, and declarative base."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+
+from app.config import settings
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+engine = create_async_engine(settings.database_url)
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+
+
+async def get_session() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding one session per request."""
+    async with SessionLocal() as session:
+        yield session
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Short-lived session for one unit of work.
+
+    An AsyncSession cannot multiplex statements, so coroutines that should
+    overlap DB round-trips under asyncio.gather each open their own scope
+    instead of sharing the request session.
+    """
+    async with SessionLocal() as session:
+        yield session
+
+
+async def init_db() -> None:
+    from app import models  # noqa: F401  ensure tables are registered
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
@@ -0,0 +1,23 @@
+"""FastAPI application wiring: routers and startup work."""
+
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from app.db import init_db
+from app.services.video_processor import warmup_jit
+from app.templating import templates
+from app.views import rooms, search
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    warmup_jit()
+    yield
+
+
+app = FastAPI(title="Flot Inventory", lifespan=lifespan)
+app.state.templates = templates
+app.include_router(rooms.router)
+app.include_router(search.router)
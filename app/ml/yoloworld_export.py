@@ -0,0 +1,89 @@
+"""Shared YOLO-World ONNX export: vocabulary, compat shim, and the export.
+
+Single home for what used to be duplicated between models/ and scripts/
+export entry points, so export-path changes land once instead of drifting
+across two copies.
+"""
+
+import shutil
+from pathlib import Path
+
+MODEL_NAME = "yolov8s-worldv2.pt"
+
+# Deduplicated once at import through dict.fromkeys — C-level insertion with
+# preserved order, no Python-side seen-set loop at export time.
+HOUSEHOLD_VOCABULARY = tuple(
+    dict.fromkeys(
+        s.lower()
+        for s in (
+            "sofa", "couch", "armchair", "chair", "dining chair", "office chair",
+            "table", "dining table", "coffee table", "side table", "desk",
+            "bookshelf", "shelf", "cabinet", "dresser", "wardrobe", "nightstand",
+            "bed", "mattress", "headboard", "bench", "stool", "ottoman",
+            "television", "tv", "monitor", "computer", "laptop", "keyboard",
+            "mouse", "printer", "router", "speaker", "soundbar", "headphones",
+            "game console", "tablet", "phone", "camera", "projector",
+            "refrigerator", "freezer", "oven", "stove", "microwave",
+            "dishwasher", "washing machine", "dryer", "vacuum cleaner",
+            "air conditioner", "fan", "space heater", "air purifier",
+            "coffee maker", "kettle", "toaster", "blender", "mixer",
+            "lamp", "floor lamp", "desk lamp", "chandelier", "mirror",
+            "painting", "picture frame", "artwork", "sculpture", "vase",
+            "clock", "rug", "curtains", "plant", "book", "guitar", "piano",
+            "keyboard instrument", "bicycle", "treadmill", "toolbox", "drill",
+            "ladder", "luggage", "suitcase",
+        )
+    )
+)
+
+
+def _shim_pkg_resources() -> None:
+    """Satisfy ultralytics' pkg_resources import on setuptools >= 81.
+
+    Runs inside do_export() so tools that merely import this module (test
+    collection, autoreload, linters) don't pay the import or have
+    sys.modules polluted.
+    """
+    try:
+        import pkg_resources  # noqa: F401
+    except ImportError:
+        import sys
+        import types
+
+        from packaging import version as _version
+
+        shim = types.ModuleType("pkg_resources")
+        shim.parse_version = _version.parse
+        sys.modules["pkg_resources"] = shim
+
+
+def do_export(dest: Path | None = None) -> Path:
+    """Export the vocabulary-primed model to ONNX.
+
+    With `dest` the artifact is moved there (parents created); otherwise the
+    path ultralytics wrote is returned as-is.
+    """
+    _shim_pkg_resources()
+    from ultralytics import YOLOWorld
+
+    model = YOLOWorld(MODEL_NAME)
+    model.set_classes(list(HOUSEHOLD_VOCABULARY))
+    exported = Path(
+        model.export(
+            format="onnx",
+            imgsz=640,
+            simplify=True,
+            # Static shapes let ORT pre-plan memory and fuse Conv+BN+Act; FP16
+            # halves the file and inference bandwidth; baked-in NMS removes the
+            # Python-side box filtering from every detection.
+            dynamic=False,
+            opset=17,
+            half=True,
+            nms=True,
+        )
+    )
+    if dest is None:
+        return exported
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(exported), dest)
+    return dest
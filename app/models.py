@@ -0,0 +1,81 @@
+"""ORM models: rooms, items (with book subtype), and capture sessions."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, func, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db import Base
+
+
+class Room(Base):
+    __tablename__ = "rooms"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), unique=True)
+    description: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    items: Mapped[list["Item"]] = relationship(back_populates="room")
+
+
+class Item(Base):
+    """A confirmed inventory item. Books are a single-table subtype."""
+
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    type: Mapped[str] = mapped_column(String(20), default="item")
+    name: Mapped[str] = mapped_column(String(200))
+    description: Mapped[str | None] = mapped_column(Text)
+    category: Mapped[str] = mapped_column(String(50), default="other")
+    condition: Mapped[str | None] = mapped_column(String(20))
+    confidence_score: Mapped[float | None] = mapped_column(Float)
+    estimated_value: Mapped[float | None] = mapped_column(Float)
+    replacement_cost: Mapped[float | None] = mapped_column(Float)
+    serial_number: Mapped[str | None] = mapped_column(String(100))
+    image_path: Mapped[str | None] = mapped_column(String(500))
+    voice_context: Mapped[str | None] = mapped_column(Text)
+    source_type: Mapped[str | None] = mapped_column(String(20))
+    source_session_id: Mapped[int | None] = mapped_column(ForeignKey("capture_sessions.id"))
+    room_id: Mapped[int | None] = mapped_column(ForeignKey("rooms.id"))
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+
+    room: Mapped[Room | None] = relationship(back_populates="items")
+
+    __mapper_args__ = {"polymorphic_on": "type", "polymorphic_identity": "item"}
+    # Partial index backing the low-confidence dashboard query; most items
+    # have high confidence, so indexing only the scored rows keeps it small.
+    # Note: substring search ('%q%') cannot use an index — SQLite's LIKE
+    # optimization needs an anchored prefix — so there is deliberately no
+    # index on lower(name)/lower(description); it would be pure write and
+    # storage overhead. Moving to FTS5 is the upgrade path if search volume
+    # ever makes the scan hurt.
+    __table_args__ = (
+        Index(
+            "ix_items_confidence",
+            "confidence_score",
+            sqlite_where=text("confidence_score IS NOT NULL"),
+        ),
+    )
+
+
+class Book(Item):
+    isbn: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    author: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    publisher: Mapped[str | None] = mapped_column(String(200), nullable=True)
+
+    __mapper_args__ = {"polymorphic_identity": "book"}
+
+
+class CaptureSession(Base):
+    __tablename__ = "capture_sessions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    room_id: Mapped[int | None] = mapped_column(ForeignKey("rooms.id"))
+    mode: Mapped[str] = mapped_column(String(20))  # video | image | rapid | scan
+    status: Mapped[str] = mapped_column(String(20), default="active")
+    transcript_json: Mapped[str | None] = mapped_column(Text)
+    item_count: Mapped[int | None] = mapped_column(default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime)
@@ -0,0 +1,310 @@
+"""Repository layer wrapping session queries for rooms and items."""
+
+import time
+from typing import AsyncIterator
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+from app.models import Book, Item, Room
+
+# id -> name map shared across export/insurance flows. Rooms change rarely but
+# the map was being rebuilt (full table query + dict comprehension) several
+# times per report; a short TTL collapses those into one query per minute,
+# and room creation invalidates it eagerly.
+_ROOM_MAP_TTL = 60.0
+_room_map: tuple[float, dict[int, str]] | None = None
+
+# Monotonic version stamp for the room table, bumped by every room mutation.
+# The cached dropdown list below is keyed on it, so within one process any
+# create/update/delete invalidates immediately. The version is process-local,
+# though — under multiple gunicorn workers a mutation only bumps the worker
+# that handled it — so the cache also carries the same TTL backstop as the
+# name map, capping cross-worker staleness at _ROOM_MAP_TTL.
+_rooms_version = 0
+_rooms_cache: tuple[float, int, list[Room]] | None = None
+
+
+def rooms_version() -> int:
+    """Current room-table version stamp, for version-keyed page caches."""
+    return _rooms_version
+
+
+def bump_rooms_version() -> None:
+    """Invalidate room-derived caches after a mutation commits."""
+    global _rooms_version, _rooms_cache, _room_map
+    _rooms_version += 1
+    _rooms_cache = None
+    _room_map = None
+
+
+class RoomRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, room_id: int) -> Room | None:
+        return await self.session.get(Room, room_id)
+
+    async def get_name(self, room_id: int) -> str | None:
+        """Scalar name lookup for callers that don't need the ORM object."""
+        return await self.session.scalar(select(Room.name).where(Room.id == room_id))
+
+    async def get_name_map(self) -> dict[int, str]:
+        """Cached id -> name map for labeling items outside the ORM."""
+        global _room_map
+        now = time.monotonic()
+        if _room_map is not None and now - _room_map[0] < _ROOM_MAP_TTL:
+            return _room_map[1]
+        rows = await self.session.execute(select(Room.id, Room.name))
+        name_map = dict(rows.all())
+        _room_map = (now, name_map)
+        return name_map
+
+    async def get_all(self) -> list[Room]:
+        result = await self.session.scalars(select(Room).order_by(Room.name))
+        return list(result)
+
+    async def get_all_cached(self) -> list[Room]:
+        """Version-cached room list for dropdowns and filters.
+
+        The rows are detached but fully loaded, which is all a dropdown
+        needs; mutations in this process bump the version so the next call
+        re-queries, and the TTL re-queries eventually even when the mutation
+        happened in a sibling worker.
+        """
+        global _rooms_cache
+        now = time.monotonic()
+        if (
+            _rooms_cache is not None
+            and _rooms_cache[1] == _rooms_version
+            and now - _rooms_cache[0] < _ROOM_MAP_TTL
+        ):
+            return _rooms_cache[2]
+        rooms = await self.get_all()
+        _rooms_cache = (now, _rooms_version, rooms)
+        return rooms
+
+    async def get_with_items(self, room_id: int) -> Room | None:
+        """Room plus its items in one selectin round-trip.
+
+        raiseload on everything else turns any accidental lazy load into an
+        error instead of a silent extra query.
+        """
+        return await self.session.scalar(
+            select(Room)
+            .options(selectinload(Room.items), raiseload("*"))
+            .where(Room.id == room_id)
+        )
+
+    async def get_all_with_items(self) -> list[Room]:
+        result = await self.session.scalars(
+            select(Room).options(selectinload(Room.items)).order_by(Room.name)
+        )
+        return list(result)
+
+    async def get_by_name(self, name: str) -> Room | None:
+        return await self.session.scalar(select(Room).where(Room.name == name))
+
+    async def create(self, name: str, description: str | None = None) -> Room:
+        room = Room(name=name, description=description)
+        self.session.add(room)
+        await self.session.flush()
+        bump_rooms_version()
+        return room
+
+
+class ItemRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get(self, item_id: int) -> Item | None:
+        return await self.session.get(Item, item_id)
+
+    async def get_all(self, limit: int = 100, offset: int = 0) -> list[Item]:
+        result = await self.session.scalars(
+            select(Item).order_by(Item.created_at.desc()).limit(limit).offset(offset)
+        )
+        return list(result)
+
+    async def get_by_room(self, room_id: int) -> list[Item]:
+        result = await self.session.scalars(select(Item).where(Item.room_id == room_id))
+        return list(result)
+
+    async def get_recent(self, limit: int = 8) -> list[Item]:
+        result = await self.session.scalars(
+            select(Item).order_by(Item.created_at.desc()).limit(limit)
+        )
+        return list(result)
+
+    async def get_low_confidence(self, limit: int = 8, threshold: float = 0.7) -> list[Item]:
+        """Items whose detection confidence warrants a manual look.
+
+        Backed by the partial index on confidence_score, so this reads only
+        flagged rows instead of scanning and filtering client-side.
+        """
+        result = await self.session.scalars(
+            select(Item)
+            .where(Item.confidence_score < threshold)
+            .order_by(Item.created_at.desc())
+            .limit(limit)
+        )
+        return list(result)
+
+    async def iter_filtered(
+        self, room_ids: list[int] | None = None, category: str | None = None
+    ) -> AsyncIterator[Item]:
+        """Stream items matching the filter instead of materializing them.
+
+        Export and insurance reports previously pulled every row into a list
+        and filtered in Python; pushing the filter into WHERE and consuming
+        the server-side cursor keeps memory at O(1) rows and skips hydrating
+        rows the report would discard.
+        """
+        stmt = select(Item).order_by(Item.created_at)
+        if room_ids is not None:
+            stmt = stmt.where(Item.room_id.in_(room_ids))
+        if category:
+            stmt = stmt.where(Item.category == category)
+        result = await self.session.stream_scalars(stmt)
+        async for item in result:
+            yield item
+
+    # Effective value used everywhere a rollup needs one number per item.
+    _VALUE = func.coalesce(Item.replacement_cost, Item.estimated_value, 0)
+
+    async def aggregate_by_room(self, room_ids: list[int] | None = None) -> list[tuple]:
+        """(room_id, item count, summed value) per room, grouped in SQL.
+
+        One GROUP BY returns O(rooms) rows instead of hydrating every item so
+        Python can add floats the database already knows how to add.
+        """
+        stmt = select(
+            Item.room_id, func.count(Item.id), func.coalesce(func.sum(self._VALUE), 0)
+        ).group_by(Item.room_id)
+        if room_ids is not None:
+            stmt = stmt.where(Item.room_id.in_(room_ids))
+        return [tuple(row) for row in await self.session.execute(stmt)]
+
+    async def aggregate_by_category(self, room_ids: list[int] | None = None) -> list[tuple]:
+        """(category, item count, summed value) per category via GROUP BY."""
+        stmt = select(
+            Item.category, func.count(Item.id), func.coalesce(func.sum(self._VALUE), 0)
+        ).group_by(Item.category)
+        if room_ids is not None:
+            stmt = stmt.where(Item.room_id.in_(room_ids))
+        return [tuple(row) for row in await self.session.execute(stmt)]
+
+    async def get_room_stats_all(self) -> dict[int, tuple[int, float]]:
+        """get_room_stats for every room at once, in a single GROUP BY."""
+        rows = await self.session.execute(
+            select(
+                Item.room_id,
+                func.count(Item.id),
+                func.coalesce(func.sum(Item.estimated_value), 0),
+            ).group_by(Item.room_id)
+        )
+        return {room_id: (count, float(value)) for room_id, count, value in rows}
+
+    async def get_room_stats(self, room_id: int) -> tuple[int, float]:
+        """(item count, summed estimated value) for one room, computed in SQL."""
+        count, value = (
+            await self.session.execute(
+                select(
+                    func.count(Item.id),
+                    func.coalesce(func.sum(Item.estimated_value), 0),
+                ).where(Item.room_id == room_id)
+            )
+        ).one()
+        return count, float(value)
+
+    async def get_stats(self) -> dict:
+        total, value = (
+            await self.session.execute(
+                select(
+                    func.count(Item.id),
+                    func.coalesce(func.sum(func.coalesce(Item.replacement_cost, Item.estimated_value, 0)), 0),
+                )
+            )
+        ).one()
+        return {"total_items": total, "total_value": float(value)}
+
+    async def search(
+        self,
+        query: str,
+        room_id: int | None = None,
+        category: str | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> tuple[list[Item], int]:
+        """One page of matches plus the unpaginated total.
+
+        COUNT(*) OVER() rides along on the page query, so the total comes
+        back without a second round-trip and without materializing every
+        matching row just to len() it. load_only restricts hydration to the
+        columns the results table renders, skipping the wide text fields
+        (description, voice_context, image_path) entirely. The window total
+        only rides on returned rows, so an offset past the last match falls
+        back to a bare count — the caller can then clamp its page number
+        instead of reporting zero results that do exist.
+        """
+        conditions = []
+        if query:
+            # Lowercase the pattern once and compare against lower(col), so
+            # matching stays case-insensitive without relying on per-dialect
+            # ILIKE behavior.
+            pattern = f"%{query.lower()}%"
+            conditions.append(
+                func.lower(Item.name).like(pattern)
+                | func.lower(Item.description).like(pattern)
+            )
+        if room_id is not None:
+            conditions.append(Item.room_id == room_id)
+        if category:
+            conditions.append(Item.category == category)
+        stmt = (
+            select(Item, func.count().over().label("total"))
+            .options(
+                load_only(
+                    Item.name,
+                    Item.category,
+                    Item.condition,
+                    Item.estimated_value,
+                    Item.room_id,
+                )
+            )
+            .where(*conditions)
+        )
+        rows = (
+            await self.session.execute(
+                stmt.order_by(Item.created_at.desc()).limit(limit).offset(offset)
+            )
+        ).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        if not offset:
+            return [], 0
+        total = await self.session.scalar(
+            select(func.count()).select_from(Item).where(*conditions)
+        )
+        return [], int(total or 0)
+
+    async def create(self, **kwargs) -> Item:
+        item = Item(**kwargs)
+        self.session.add(item)
+        await self.session.flush()
+        return item
+
+    async def bulk_create(self, specs: list[dict]) -> list[Item]:
+        """Insert many items in one statement, returning the new rows."""
+        if not specs:
+            return []
+        result = await self.session.scalars(insert(Item).returning(Item), specs)
+        return list(result)
+
+    async def bulk_create_books(self, specs: list[dict]) -> list[Book]:
+        """Book variant of bulk_create; the ORM fills in the type discriminator."""
+        if not specs:
+            return []
+        result = await self.session.scalars(insert(Book).returning(Book), specs)
+        return list(result)
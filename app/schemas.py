@@ -0,0 +1,88 @@
+"""Pydantic schemas shared across the capture pipeline."""
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DetectedObject(BaseModel):
+    """A single item detected in one frame by the vision service."""
+
+    name: str
+    description: str = ""
+    category: str = "other"
+    confidence: float = 0.0
+    estimated_value: float | None = None
+    condition: str | None = None
+    bounding_box: list[float] | None = None  # [x1, y1, x2, y2], normalized to 0..1
+    frame_path: str = ""
+    voice_context: str | None = None
+
+
+class TranscribedWord(BaseModel):
+    word: str
+    start: float
+    end: float
+
+
+class TranscriptSegment(BaseModel):
+    text: str
+    start: float
+    end: float
+    words: list[TranscribedWord] = Field(default_factory=list)
+
+
+class TranscriptionResult(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    text: str
+    language: str = "en"
+    segments: list[TranscriptSegment] = Field(default_factory=list)
+
+    # Flat word index built once at transcription time so per-frame correlation
+    # never re-walks segments. word_starts/word_ends are parallel float32
+    # ndarrays over flat_words; all three are in-memory only, never serialized.
+    flat_words: list[TranscribedWord] = Field(default_factory=list, exclude=True, repr=False)
+    word_starts: Any = Field(default=None, exclude=True, repr=False)
+    word_ends: Any = Field(default=None, exclude=True, repr=False)
+
+
+class FrameCorrelation(BaseModel):
+    """Transcript snippet matched to a frame by timestamp."""
+
+    frame_index: int
+    timestamp: float
+    transcript_snippet: str = ""
+
+
+class CaptureConfirmItem(BaseModel):
+    """One detection the user chose to keep at the end of a capture session."""
+
+    name: str
+    description: str = ""
+    category: str = "other"
+    confidence: float = 0.0
+    estimated_value: float | None = None
+    condition: str | None = None
+    voice_context: str | None = None
+    frame_path: str = ""
+    is_book: bool = False
+    isbn: str | None = None
+    author: str | None = None
+    publisher: str | None = None
+
+
+class FrameAnalysisResult(BaseModel):
+    frame_path: str
+    timestamp: float = 0.0
+    objects: list[DetectedObject] = Field(default_factory=list)
+
+
+class RoomCreate(BaseModel):
+    name: str
+    description: str | None = None
+
+
+class RoomUpdate(BaseModel):
+    name: str | None = None
+    description: str | None = None
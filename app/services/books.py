@@ -0,0 +1,45 @@
+"""Barcode scanning and ISBN metadata lookup for book detections."""
+
+from pathlib import Path
+from typing import Any
+
+import httpx
+from PIL import Image
+
+try:
+    from pyzbar import pyzbar
+except ImportError:  # libzbar is optional at runtime
+    pyzbar = None
+
+OPENLIBRARY_URL = "https://openlibrary.org/api/books"
+
+
+class BookService:
+    def scan_barcode(self, image_path: Path) -> str | None:
+        """Return the first EAN-13/ISBN barcode found in the image, if any."""
+        if pyzbar is None:
+            return None
+        with Image.open(image_path) as img:
+            decoded = pyzbar.decode(img)
+        for symbol in decoded:
+            digits = symbol.data.decode("ascii", "ignore")
+            if digits.isdigit() and len(digits) in (10, 13):
+                return digits
+        return None
+
+    async def lookup_isbn(self, isbn: str) -> dict[str, Any] | None:
+        """Fetch title/author/publisher metadata from Open Library."""
+        params = {"bibkeys": f"ISBN:{isbn}", "format": "json", "jscmd": "data"}
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(OPENLIBRARY_URL, params=params)
+        if response.status_code != 200:
+            return None
+        data = response.json().get(f"ISBN:{isbn}")
+        if not data:
+            return None
+        return {
+            "title": data.get("title"),
+            "author": ", ".join(a["name"] for a in data.get("authors", [])) or None,
+            "publisher": ", ".join(p["name"] for p in data.get("publishers", [])) or None,
+            "isbn": isbn,
+        }
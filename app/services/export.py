@@ -0,0 +1,59 @@
+"""Inventory export rendering: CSV and JSON from a stream of items."""
+
+import csv
+import io
+from typing import AsyncIterator
+
+import orjson
+
+from app.models import Item
+
+CSV_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "category",
+    "condition",
+    "estimated_value",
+    "replacement_cost",
+    "serial_number",
+    "room",
+    "created_at",
+)
+
+
+def item_row(item: Item, room_name: str | None = None) -> dict:
+    """Flatten one item into the export row shape shared by CSV and JSON."""
+    return {
+        "id": item.id,
+        "name": item.name,
+        "description": item.description,
+        "category": item.category,
+        "condition": item.condition,
+        "estimated_value": item.estimated_value,
+        "replacement_cost": item.replacement_cost,
+        "serial_number": item.serial_number,
+        "room": room_name,
+        "created_at": item.created_at.isoformat() if item.created_at else None,
+    }
+
+
+class ExportService:
+    """Renders export documents without ever holding the full item set.
+
+    Both renderers consume an async iterator of (item, room_name) pairs so the
+    repository can stream rows off a server-side cursor; memory stays at one
+    row plus the growing output buffer.
+    """
+
+    async def to_csv(self, items: AsyncIterator[tuple[Item, str | None]]) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        async for item, room_name in items:
+            writer.writerow(item_row(item, room_name))
+        return buffer.getvalue()
+
+    async def to_json(self, items: AsyncIterator[tuple[Item, str | None]]) -> bytes:
+        rows = [item_row(item, room_name) async for item, room_name in items]
+        return orjson.dumps({"items": rows, "count": len(rows)})
@@ -0,0 +1,43 @@
+"""Image persistence: uploads, confirmed-item copies, and thumbnails."""
+
+import shutil
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from app.config import settings
+
+THUMBNAIL_SIZE = (320, 320)
+
+
+class ImageService:
+    def __init__(self, base_dir: Path | None = None):
+        self.base_dir = base_dir or settings.data_dir / "images"
+
+    def _room_dir(self, room_name: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in room_name.lower())
+        room_dir = self.base_dir / safe
+        room_dir.mkdir(parents=True, exist_ok=True)
+        return room_dir
+
+    def save_upload(self, image_data: bytes, room_name: str) -> Path:
+        """Persist an uploaded photo into the room's image directory."""
+        dest = self._room_dir(room_name) / f"upload_{int(time.time() * 1000)}.jpg"
+        dest.write_bytes(image_data)
+        self._write_thumbnail(dest)
+        return dest
+
+    def save_image(self, src: Path, room_name: str) -> Path:
+        """Copy a capture frame into the room's image directory for a confirmed item."""
+        dest = self._room_dir(room_name) / f"{int(time.time() * 1000)}_{src.name}"
+        shutil.copyfile(src, dest)
+        self._write_thumbnail(dest)
+        return dest
+
+    @staticmethod
+    def _write_thumbnail(image_path: Path) -> None:
+        thumb_path = image_path.with_name(f"thumb_{image_path.name}")
+        with Image.open(image_path) as img:
+            img.thumbnail(THUMBNAIL_SIZE)
+            img.convert("RGB").save(thumb_path, "JPEG", quality=80)
@@ -0,0 +1,210 @@
+"""Voice-narration transcription and transcript-to-frame correlation."""
+
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import numpy as np
+
+try:
+    import av
+except ImportError:  # PyAV is optional; fall back to spawning ffmpeg
+    av = None
+
+from app.schemas import FrameCorrelation, TranscribedWord, TranscriptionResult, TranscriptSegment
+
+SAMPLE_RATE = 16000
+CONTEXT_WINDOW = 4.0  # seconds of narration either side of a frame timestamp
+
+ROOM_WORDS = (
+    "kitchen",
+    "living room",
+    "bedroom",
+    "bathroom",
+    "garage",
+    "office",
+    "basement",
+    "attic",
+    "dining room",
+    "hallway",
+)
+
+
+class TranscriptionService:
+    """Transcribes narration with faster-whisper and aligns it to frame timestamps."""
+
+    def __init__(self, model_size: str = "base"):
+        self.model_size = model_size
+        self._model = None
+
+    @property
+    def model(self):
+        if self._model is None:
+            from faster_whisper import WhisperModel
+
+            self._model = WhisperModel(self.model_size, compute_type="int8")
+        return self._model
+
+    def decode_audio(self, media_path: Path) -> np.ndarray | None:
+        """Demux and resample the audio track in-process with PyAV.
+
+        Opens the container once, resamples to 16kHz mono, and returns float32
+        PCM normalized to +/-1 that faster-whisper accepts directly — no
+        ffprobe/ffmpeg subprocess spawns and no intermediate WAV on disk.
+        Returns None when the container has no audio stream.
+        """
+        container = av.open(str(media_path))
+        try:
+            if not container.streams.audio:
+                return None
+            resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+            chunks: list[np.ndarray] = []
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+        finally:
+            container.close()
+        if not chunks:
+            return None
+        pcm = np.concatenate(chunks).astype(np.float32)
+        pcm /= 32768.0
+        return pcm
+
+    def extract_audio(self, video_path: Path) -> Path | None:
+        """Subprocess fallback used only when PyAV is unavailable."""
+        probe = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "a",
+                "-show_entries",
+                "stream=codec_type",
+                "-of",
+                "csv=p=0",
+                str(video_path),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if probe.returncode != 0 or not probe.stdout.strip():
+            return None
+        fd, tmp_name = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)  # ffmpeg writes by name; holding the fd just leaks it
+        audio_wav = Path(tmp_name)
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-i",
+                str(video_path),
+                "-vn",
+                "-acodec",
+                "pcm_s16le",
+                "-ar",
+                str(SAMPLE_RATE),
+                "-ac",
+                "1",
+                str(audio_wav),
+            ],
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            audio_wav.unlink(missing_ok=True)
+            return None
+        return audio_wav
+
+    def transcribe(self, source: Path | np.ndarray) -> TranscriptionResult | None:
+        """Transcribe a media file or a preloaded 16kHz mono float32 PCM array."""
+        audio: Path | np.ndarray | None = source
+        temp_wav: Path | None = None
+        if isinstance(source, Path) and av is not None:
+            audio = self.decode_audio(source)
+        elif isinstance(source, Path):
+            audio = temp_wav = self.extract_audio(source)
+        if audio is None:
+            return None
+
+        segments: list[TranscriptSegment] = []
+        texts: list[str] = []
+        flat_words: list[TranscribedWord] = []
+        starts: list[float] = []
+        ends: list[float] = []
+        try:
+            segments_iter, info = self.model.transcribe(
+                audio if isinstance(audio, np.ndarray) else str(audio), word_timestamps=True
+            )
+            # The segment iterator decodes lazily, so the temp WAV must stay
+            # until it is fully consumed.
+            for seg in segments_iter:
+                words = []
+                for w in seg.words or []:
+                    word = TranscribedWord(word=w.word, start=w.start, end=w.end)
+                    words.append(word)
+                    flat_words.append(word)
+                    starts.append(w.start)
+                    ends.append(w.end)
+                segments.append(
+                    TranscriptSegment(text=seg.text, start=seg.start, end=seg.end, words=words)
+                )
+                texts.append(seg.text)
+        finally:
+            if temp_wav is not None:
+                temp_wav.unlink(missing_ok=True)
+        if not segments:
+            return None
+        return TranscriptionResult(
+            text="".join(texts).strip(),
+            language=info.language,
+            segments=segments,
+            flat_words=flat_words,
+            word_starts=np.asarray(starts, dtype=np.float32),
+            word_ends=np.asarray(ends, dtype=np.float32),
+        )
+
+    def correlate_to_frame(self, transcript: TranscriptionResult, timestamp: float) -> str:
+        """Narration spoken within CONTEXT_WINDOW seconds of a frame timestamp."""
+        lo = timestamp - CONTEXT_WINDOW
+        hi = timestamp + CONTEXT_WINDOW
+        if transcript.word_starts is not None and len(transcript.word_starts):
+            # Binary search over the flat word index built at transcription time.
+            first = int(np.searchsorted(transcript.word_starts, lo, side="left"))
+            last = int(np.searchsorted(transcript.word_starts, hi, side="right"))
+            return "".join(w.word for w in transcript.flat_words[first:last]).strip()
+        words: list[str] = []
+        for seg in transcript.segments:
+            if seg.end < lo or seg.start > hi:
+                continue
+            for word in seg.words:
+                if lo <= word.start <= hi:
+                    words.append(word.word)
+        return "".join(words).strip()
+
+    def correlate_all_frames(
+        self, transcript: TranscriptionResult, frame_timestamps: Iterable[tuple[int, float]]
+    ) -> Iterator[FrameCorrelation]:
+        """Lazily correlate each (index, timestamp) pair to its narration.
+
+        Accepts any iterable — callers pass enumerate() directly — and yields
+        so consumers building a dict in one pass never hold an intermediate
+        list of correlations.
+        """
+        for index, timestamp in frame_timestamps:
+            yield FrameCorrelation(
+                frame_index=index,
+                timestamp=timestamp,
+                transcript_snippet=self.correlate_to_frame(transcript, timestamp),
+            )
+
+    def detect_room_mentions(self, transcript: TranscriptionResult) -> list[tuple[float, str]]:
+        """Timestamps at which the narrator names a room ("now in the kitchen...")."""
+        mentions: list[tuple[float, str]] = []
+        for seg in transcript.segments:
+            lowered = seg.text.lower()
+            for room in ROOM_WORDS:
+                if room in lowered:
+                    mentions.append((seg.start, room))
+        return mentions
@@ -0,0 +1,47 @@
+"""Text-only replacement-value estimation for items lacking a visible price cue."""
+
+from typing import Any
+
+import orjson
+from anthropic import AsyncAnthropic
+
+from app.config import settings
+
+ESTIMATE_PROMPT = """\
+Estimate the current replacement cost in USD of this household item:
+
+Name: {name}
+Description: {description}
+Condition: {condition}
+
+Respond with ONLY a JSON object: {{"estimated_value": <number>, "low": <number>, \
+"high": <number>, "reasoning": "<one sentence>"}}."""
+
+
+class ValueEstimator:
+    def __init__(self):
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key or None)
+        self.model = settings.vision_model
+
+    async def estimate_value(
+        self, name: str, description: str = "", condition: str | None = None
+    ) -> dict[str, Any]:
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=512,
+            messages=[
+                {
+                    "role": "user",
+                    "content": ESTIMATE_PROMPT.format(
+                        name=name, description=description, condition=condition or "unknown"
+                    ),
+                }
+            ],
+        )
+        text = response.content[0].text.strip()
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+        try:
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
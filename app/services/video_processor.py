@@ -0,0 +1,232 @@
+"""Frame extraction, quality filtering, and detection post-processing for scan videos."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2
+import numpy as np
+from cv2 import img_hash
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist
+
+from app.schemas import DetectedObject, FrameAnalysisResult
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy fallback below is still vectorized
+    njit = None
+
+BLUR_THRESHOLD = 100.0  # variance of Laplacian below this is considered too blurry
+PHASH_DISTANCE = 10  # Hamming distance under this counts as a duplicate frame
+NAME_SIMILARITY = 0.82
+IOU_THRESHOLD = 0.5  # boxes overlapping this much are treated as the same item
+
+
+def _pairwise_iou_np(boxes: np.ndarray) -> np.ndarray:
+    """(N,4) float32 boxes -> (N,N) IoU matrix, NumPy broadcast version."""
+    x1 = np.maximum(boxes[:, None, 0], boxes[None, :, 0])
+    y1 = np.maximum(boxes[:, None, 1], boxes[None, :, 1])
+    x2 = np.minimum(boxes[:, None, 2], boxes[None, :, 2])
+    y2 = np.minimum(boxes[:, None, 3], boxes[None, :, 3])
+    inter = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    areas = np.clip(boxes[:, 2] - boxes[:, 0], 0, None) * np.clip(boxes[:, 3] - boxes[:, 1], 0, None)
+    union = areas[:, None] + areas[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0).astype(np.float32)
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _pairwise_iou(boxes):  # pragma: no cover - compiled
+        n = boxes.shape[0]
+        out = np.zeros((n, n), dtype=np.float32)
+        for i in range(n):
+            a_w = boxes[i, 2] - boxes[i, 0]
+            a_h = boxes[i, 3] - boxes[i, 1]
+            a_area = max(a_w, 0.0) * max(a_h, 0.0)
+            for j in range(i + 1, n):
+                ix1 = max(boxes[i, 0], boxes[j, 0])
+                iy1 = max(boxes[i, 1], boxes[j, 1])
+                ix2 = min(boxes[i, 2], boxes[j, 2])
+                iy2 = min(boxes[i, 3], boxes[j, 3])
+                inter = max(ix2 - ix1, 0.0) * max(iy2 - iy1, 0.0)
+                b_w = boxes[j, 2] - boxes[j, 0]
+                b_h = boxes[j, 3] - boxes[j, 1]
+                union = a_area + max(b_w, 0.0) * max(b_h, 0.0) - inter
+                if union > 0.0:
+                    iou = inter / union
+                    out[i, j] = iou
+                    out[j, i] = iou
+        return out
+
+else:
+    _pairwise_iou = _pairwise_iou_np
+
+
+def _cluster_labels_py(dup):  # pragma: no cover - njit-compiled when numba is present
+    """Union-find over a boolean (N,N) duplicate-pair matrix -> root label per row."""
+    n = dup.shape[0]
+    parent = np.arange(n, dtype=np.int32)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if dup[i, j]:
+                ri = i
+                while parent[ri] != ri:
+                    parent[ri] = parent[parent[ri]]
+                    ri = parent[ri]
+                rj = j
+                while parent[rj] != rj:
+                    parent[rj] = parent[parent[rj]]
+                    rj = parent[rj]
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+    for i in range(n):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        parent[i] = root
+    return parent
+
+
+_cluster_labels = njit(cache=True)(_cluster_labels_py) if njit is not None else _cluster_labels_py
+
+
+def warmup_jit() -> None:
+    """Trigger numba compilation at startup so the first dedup doesn't pay it."""
+    _pairwise_iou(np.zeros((2, 4), dtype=np.float32))
+    _cluster_labels(np.zeros((2, 2), dtype=np.bool_))
+
+# img_hash hashers reuse internal scratch Mats between compute() calls, so a
+# single shared instance silently corrupts hashes under concurrent use (the
+# quality filter fans out across a thread pool, and vision hashes on the event
+# loop at the same time). One hasher per thread keeps the reuse win without
+# sharing the scratch buffers.
+_PHASH_LOCAL = threading.local()
+
+
+def _phash_u64(bgr_frame: np.ndarray) -> int:
+    """64-bit perceptual hash computed entirely in OpenCV's C++ img_hash module."""
+    hasher = getattr(_PHASH_LOCAL, "hasher", None)
+    if hasher is None:
+        hasher = _PHASH_LOCAL.hasher = img_hash.PHash_create()
+    return int.from_bytes(hasher.compute(bgr_frame).tobytes(), "little")
+
+
+class VideoProcessor:
+    """Turns a room-scan video into analyzable frames and merges duplicate detections."""
+
+    def __init__(self, frame_interval: float = 1.0):
+        self.frame_interval = frame_interval
+
+    def extract_frames(self, video_path: Path, out_dir: Path) -> list[tuple[Path, float]]:
+        """Sample one frame every `frame_interval` seconds into out_dir as JPEGs."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        cap = cv2.VideoCapture(str(video_path))
+        try:
+            fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+            step = max(1, round(fps * self.frame_interval))
+            frames: list[tuple[Path, float]] = []
+            index = 0
+            while True:
+                ok, frame = cap.read()
+                if not ok:
+                    break
+                if index % step == 0:
+                    timestamp = index / fps
+                    frame_path = out_dir / f"frame_{len(frames):04d}.jpg"
+                    cv2.imwrite(str(frame_path), frame)
+                    frames.append((frame_path, timestamp))
+                index += 1
+            return frames
+        finally:
+            cap.release()
+
+    def _filter_quality_frames(self, frames: list[tuple[Path, float]]) -> list[tuple[Path, float]]:
+        """Drop blurry frames and near-duplicates of frames already kept.
+
+        Scoring (JPEG decode, Laplacian variance, phash) is per-frame independent
+        and spends its time in GIL-releasing cv2 calls, so it runs on a thread
+        pool. The duplicate pass stays sequential: the first frame with a given
+        hash wins, which depends on order.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            scored = list(pool.map(self._score_frame, frames))
+
+        # Fixed-capacity hash store: one uint64 slot per candidate frame, filled
+        # behind a write cursor, so the duplicate scan is a vectorized
+        # xor + popcount over a contiguous array with no per-accept reallocation.
+        kept: list[tuple[Path, float]] = []
+        seen = np.empty(len(frames), dtype=np.uint64)
+        n = 0
+        for entry in scored:
+            if entry is None:
+                continue
+            frame_path, timestamp, phash = entry
+            if n and (np.bitwise_count(seen[:n] ^ np.uint64(phash)) < PHASH_DISTANCE).any():
+                continue
+            seen[n] = phash
+            n += 1
+            kept.append((frame_path, timestamp))
+        return kept
+
+    @staticmethod
+    def _score_frame(frame: tuple[Path, float]) -> tuple[Path, float, int] | None:
+        """Decode, blur-check, and hash one frame; None if unreadable or blurry."""
+        frame_path, timestamp = frame
+        img = cv2.imread(str(frame_path))
+        if img is None:
+            return None
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        if cv2.Laplacian(gray, cv2.CV_64F).var() < BLUR_THRESHOLD:
+            return None
+        return frame_path, timestamp, _phash_u64(img)
+
+    def _deduplicate_objects(
+        self, frame_results: list[FrameAnalysisResult]
+    ) -> list[DetectedObject]:
+        """Merge detections of the same physical item seen across multiple frames.
+
+        Everything pairwise runs as (N,N) matrix kernels: box overlap in the
+        compiled IoU routine, string similarity in rapidfuzz's C cdist (WRatio
+        also catches the "lamp" vs "floor lamp" containment case), and the
+        transitive grouping in a union-find kernel over the combined duplicate
+        mask. Python never touches an O(N^2) loop, so dedup stays negligible
+        even at hundreds of detections per session.
+        """
+        objs: list[DetectedObject] = []
+        names: list[str] = []
+        descs: list[str] = []
+        for result in frame_results:
+            for obj in result.objects:
+                objs.append(obj)
+                names.append(obj.name.lower())
+                descs.append(obj.description.lower())
+        n = len(objs)
+        if n < 2:
+            return objs
+
+        conf = np.array([o.confidence for o in objs], dtype=np.float32)
+        boxes = np.array(
+            [o.bounding_box if o.bounding_box else (0.0, 0.0, 0.0, 0.0) for o in objs],
+            dtype=np.float32,
+        )
+        iou = _pairwise_iou(boxes)
+        similarity = NAME_SIMILARITY * 100  # rapidfuzz scores are 0-100
+        name_sim = cdist(names, names, scorer=fuzz.WRatio, dtype=np.uint8, workers=-1)
+        desc_sim = cdist(descs, descs, scorer=fuzz.ratio, dtype=np.uint8, workers=-1)
+        # Empty descriptions trivially score 100 against each other; only let
+        # description similarity vote when both sides actually have one.
+        has_desc = np.array([bool(d) for d in descs], dtype=np.bool_)
+        desc_ok = has_desc[:, None] & has_desc[None, :]
+        dup = (iou >= IOU_THRESHOLD) | (name_sim >= similarity) | (
+            desc_ok & (desc_sim >= similarity)
+        )
+        labels = _cluster_labels(np.ascontiguousarray(dup))
+
+        merged: list[DetectedObject] = []
+        for root in np.unique(labels):
+            idx = np.flatnonzero(labels == root)
+            merged.append(objs[int(idx[conf[idx].argmax()])])
+        return merged
@@ -0,0 +1,406 @@
+"""Claude-backed vision analysis of capture frames."""
+
+import base64
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+import cv2
+import numpy as np
+import orjson
+from anthropic import AsyncAnthropic
+from pydantic import TypeAdapter, ValidationError
+
+from app.config import settings
+from app.schemas import DetectedObject
+from app.services.video_processor import _phash_u64
+
+BATCH_PROMPT = """\
+You are cataloguing household items for a home inventory. Identify every distinct \
+physical item visible in this photo that a homeowner would want documented for \
+insurance: furniture, electronics, appliances, artwork, books, tools, and so on. \
+Ignore walls, floors, fixtures, and packaging.
+
+Respond with ONLY a JSON array. Each element must have:
+- "name": short item name
+- "description": one sentence covering brand, model, color, or material if visible
+- "category": one of electronics, furniture, appliances, books, art, tools, \
+clothing, kitchenware, other
+- "confidence": 0.0-1.0 that this is a real, distinct item
+- "estimated_value": replacement cost in USD, or null if you cannot tell
+- "condition": one of new, good, fair, poor, or null
+- "bounding_box": [x1, y1, x2, y2] normalized to 0..1, or null
+
+Do not invent items you cannot see. Do not wrap the array in prose."""
+
+VOICE_CONTEXT_BLOCK = """\
+The person filming said this while capturing the photo:
+"{voice_context}"
+
+Use the narration to resolve brands, models, and values you cannot see, and to \
+include items the narration names even if partially occluded."""
+
+MULTI_IMAGE_SUFFIX = """\
+
+
+You are given several numbered photos from one capture burst. Respond with ONLY \
+a JSON array containing one array per photo, in photo order, each inner array \
+following the schema above. Use [] for a photo with no items."""
+
+DETAIL_PROMPT = """\
+Look closely at the single household item named after the photo. Respond with \
+ONLY a JSON object with keys "brand", "model", "serial_number", \
+"estimated_value", and "condition". Use null for anything you cannot determine \
+from the image."""
+
+# The instruction text is identical for every frame in a session; marking it as a
+# cacheable prefix lets the API reuse its server-side KV cache instead of paying
+# prefill over the same ~400 tokens per frame. Dynamic content (image, narration,
+# item name) always comes after the cached block.
+_CACHED = {"type": "ephemeral"}
+
+MAX_EDGE = 1024  # long-edge pixels sent to the model
+JPEG_QUALITY = 85
+
+_OBJECT_LIST_ADAPTER = TypeAdapter(list[DetectedObject])
+
+
+class _AnalysisCache:
+    """LRU of frame analyses keyed by image content and narration.
+
+    Rapid-capture bursts and scan sessions contain many near-duplicate frames
+    (the user lingers on a shelf). Lookups try an exact blake2b content-hash
+    match first — an O(1) dict hit that skips even the JPEG decode — then fall
+    back to a perceptual-hash scan where any key within HAMMING_TOLERANCE bits
+    reuses the cached detections. Narration is part of both keys: different
+    voice context must re-run the prompt, since it steers what the model
+    reports.
+    """
+
+    MAX_ENTRIES = 512
+    HAMMING_TOLERANCE = 4
+
+    def __init__(self):
+        self._exact: OrderedDict[tuple[bytes, str | None], list[DetectedObject]] = OrderedDict()
+        self._entries: OrderedDict[tuple[int, str | None], list[DetectedObject]] = OrderedDict()
+
+    def get_exact(self, digest: bytes, voice_context: str | None) -> list[DetectedObject] | None:
+        objects = self._exact.get((digest, voice_context))
+        if objects is not None:
+            self._exact.move_to_end((digest, voice_context))
+        return objects
+
+    def get(self, phash: int, voice_context: str | None) -> list[DetectedObject] | None:
+        for key, objects in self._entries.items():
+            if key[1] == voice_context and (key[0] ^ phash).bit_count() <= self.HAMMING_TOLERANCE:
+                self._entries.move_to_end(key)
+                return objects
+        return None
+
+    def put(
+        self,
+        digest: bytes,
+        phash: int | None,
+        voice_context: str | None,
+        objects: list[DetectedObject],
+    ) -> None:
+        self._exact[(digest, voice_context)] = objects
+        self._exact.move_to_end((digest, voice_context))
+        while len(self._exact) > self.MAX_ENTRIES:
+            self._exact.popitem(last=False)
+        if phash is not None:
+            self._entries[(phash, voice_context)] = objects
+            self._entries.move_to_end((phash, voice_context))
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
+
+
+# Module-level so the cache survives per-request service construction.
+_ANALYSIS_CACHE = _AnalysisCache()
+
+
+class _JSONArrayStream:
+    """Extracts complete top-level objects from a JSON array arriving in chunks.
+
+    A bracket-depth state machine (string- and escape-aware) that emits each
+    object's raw text as soon as its closing brace arrives, so parsing overlaps
+    the network instead of waiting for the full response body. Anything outside
+    braces — the array brackets, commas, markdown fences — is ignored.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._in_object = False
+        self._current: list[str] = []
+
+    def feed(self, chunk: str) -> list[str]:
+        complete: list[str] = []
+        for ch in chunk:
+            if self._in_object:
+                self._current.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                if not self._in_object:
+                    self._in_object = True
+                    self._current = ["{"]
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._in_object and self._depth == 0:
+                    complete.append("".join(self._current))
+                    self._in_object = False
+                    self._current = []
+        return complete
+
+
+class LocalVisionService:
+    """Analyzes frames with the configured Claude vision model."""
+
+    def __init__(self):
+        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key or None)
+        self.model = settings.vision_model
+
+    async def analyze_frame(
+        self,
+        image: bytes | Path | str,
+        voice_context: str | None = None,
+        frame_path: str | None = None,
+    ) -> list[DetectedObject]:
+        """Detect inventory items in one frame, optionally steered by narration.
+
+        `image` may be a path or raw encoded bytes — the rapid-capture hot path
+        passes bytes straight from the upload so analysis never waits on a disk
+        round-trip, with `frame_path` supplying the label detections carry.
+        Results are served from the analysis cache when the same image bytes —
+        or a perceptually near-identical frame — were analyzed recently with the
+        same narration; cached detections come back as copies carrying this
+        frame's path.
+        """
+        if frame_path is None:
+            frame_path = "" if isinstance(image, (bytes, bytearray)) else str(image)
+        raw = self._raw_bytes(image)
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+        cached = _ANALYSIS_CACHE.get_exact(digest, voice_context)
+        if cached is None:
+            img = self._decode(raw)
+            phash = _phash_u64(img) if img is not None else None
+            if phash is not None:
+                cached = _ANALYSIS_CACHE.get(phash, voice_context)
+        else:
+            phash = None
+        if cached is not None:
+            return [
+                obj.model_copy(update={"frame_path": str(frame_path)}) for obj in cached
+            ]
+        objects = [
+            obj
+            async for obj in self.analyze_frame_stream(raw, voice_context, frame_path=frame_path)
+        ]
+        if objects:
+            _ANALYSIS_CACHE.put(
+                digest, phash, voice_context, [obj.model_copy(deep=True) for obj in objects]
+            )
+        return objects
+
+    async def analyze_frame_stream(
+        self,
+        image: bytes | Path | str,
+        voice_context: str | None = None,
+        frame_path: str | None = None,
+    ) -> AsyncIterator[DetectedObject]:
+        """Stream detections as they arrive instead of awaiting the full response.
+
+        For a multi-KB JSON array the last bytes land seconds after the first;
+        each object is validated the moment its closing brace streams in, so
+        downstream work can start on early detections.
+        """
+        if frame_path is None:
+            frame_path = "" if isinstance(image, (bytes, bytearray)) else str(image)
+        image_b64 = self._load_image_b64(image)
+        content: list[dict] = [
+            {"type": "text", "text": BATCH_PROMPT, "cache_control": _CACHED},
+            {
+                "type": "image",
+                "source": {"type": "base64", "media_type": "image/jpeg", "data": image_b64},
+            },
+        ]
+        if voice_context:
+            content.append(
+                {"type": "text", "text": VOICE_CONTEXT_BLOCK.format(voice_context=voice_context)}
+            )
+        parser = _JSONArrayStream()
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            messages=[{"role": "user", "content": content}],
+        ) as stream:
+            async for text in stream.text_stream:
+                for raw in parser.feed(text):
+                    try:
+                        obj = DetectedObject.model_validate(orjson.loads(raw))
+                    except (orjson.JSONDecodeError, ValidationError):
+                        continue
+                    obj.frame_path = frame_path
+                    if voice_context:
+                        obj.voice_context = voice_context
+                    yield obj
+
+    async def analyze_batch(
+        self,
+        images: list[bytes | Path | str],
+        voice_contexts: list[str | None] | None = None,
+        frame_paths: list[str] | None = None,
+    ) -> list[list[DetectedObject]]:
+        """Analyze several frames in one model invocation.
+
+        Batching amortizes the per-call overhead (prompt prefill, request
+        round-trip) across the chunk; the model returns one detection array per
+        photo in order. Single-image batches fall through to analyze_frame so
+        they still hit the perceptual-hash cache.
+        """
+        if not images:
+            return []
+        if frame_paths is None:
+            frame_paths = [
+                "" if isinstance(img, (bytes, bytearray)) else str(img) for img in images
+            ]
+        voice_contexts = voice_contexts or [None] * len(images)
+        if len(images) == 1:
+            return [
+                await self.analyze_frame(
+                    images[0], voice_context=voice_contexts[0], frame_path=frame_paths[0]
+                )
+            ]
+
+        content: list[dict] = [
+            {"type": "text", "text": BATCH_PROMPT + MULTI_IMAGE_SUFFIX, "cache_control": _CACHED}
+        ]
+        for idx, img in enumerate(images):
+            content.append({"type": "text", "text": f"Photo {idx + 1}:"})
+            content.append(
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/jpeg",
+                        "data": self._load_image_b64(img),
+                    },
+                }
+            )
+            if voice_contexts[idx]:
+                content.append(
+                    {
+                        "type": "text",
+                        "text": f'Narration for photo {idx + 1}: "{voice_contexts[idx]}"',
+                    }
+                )
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=4096 * 2,
+            messages=[{"role": "user", "content": content}],
+        )
+        groups = self._parse_multi_response(response.content[0].text, len(images))
+        for objects, frame_path, vc in zip(groups, frame_paths, voice_contexts):
+            for obj in objects:
+                obj.frame_path = frame_path
+                if vc:
+                    obj.voice_context = vc
+        return groups
+
+    @classmethod
+    def _parse_multi_response(cls, text: str, expected: int) -> list[list[DetectedObject]]:
+        try:
+            data = orjson.loads(cls._strip_fences(text))
+        except orjson.JSONDecodeError:
+            return [[] for _ in range(expected)]
+        groups: list[list[DetectedObject]] = []
+        for entry in data if isinstance(data, list) else []:
+            try:
+                groups.append(_OBJECT_LIST_ADAPTER.validate_python(entry))
+            except ValidationError:
+                groups.append([])
+        groups = groups[:expected]
+        groups.extend([] for _ in range(expected - len(groups)))
+        return groups
+
+    async def analyze_detail(self, frame_path: Path | str, item_name: str) -> dict[str, Any]:
+        """Ask for close-up detail (brand/model/serial) on a single known item."""
+        image_b64 = self._load_image_b64(frame_path)
+        response = await self.client.messages.create(
+            model=self.model,
+            max_tokens=1024,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": DETAIL_PROMPT, "cache_control": _CACHED},
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": "image/jpeg",
+                                "data": image_b64,
+                            },
+                        },
+                        {"type": "text", "text": f'Item: "{item_name}"'},
+                    ],
+                }
+            ],
+        )
+        return self._parse_detail_response(response.content[0].text)
+
+    @staticmethod
+    def _decode(image: bytes | Path | str):
+        if isinstance(image, (bytes, bytearray)):
+            return cv2.imdecode(np.frombuffer(image, np.uint8), cv2.IMREAD_COLOR)
+        return cv2.imread(str(image))
+
+    @staticmethod
+    def _raw_bytes(image: bytes | Path | str) -> bytes:
+        return bytes(image) if isinstance(image, (bytes, bytearray)) else Path(image).read_bytes()
+
+    @classmethod
+    def _load_image_b64(cls, image: bytes | Path | str) -> str:
+        """Re-encode the frame to at most MAX_EDGE px / JPEG q85 before upload.
+
+        The API resizes large images server-side anyway, so shipping 1080p/4K
+        frames just inflates upload bytes and base64 CPU 3-5x for no accuracy
+        gain.
+        """
+        img = cls._decode(image)
+        if img is None:
+            return base64.b64encode(cls._raw_bytes(image)).decode("ascii")
+        h, w = img.shape[:2]
+        scale = MAX_EDGE / max(h, w)
+        if scale < 1.0:
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        ok, buf = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+        if not ok:
+            return base64.b64encode(cls._raw_bytes(image)).decode("ascii")
+        return base64.b64encode(buf).decode("ascii")
+
+    @staticmethod
+    def _strip_fences(text: str) -> str:
+        """Models occasionally wrap the JSON in a markdown code fence."""
+        text = text.strip()
+        return text.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+
+    @classmethod
+    def _parse_detail_response(cls, text: str) -> dict[str, Any]:
+        try:
+            data = orjson.loads(cls._strip_fences(text))
+        except orjson.JSONDecodeError:
+            return {}
+        return data if isinstance(data, dict) else {}
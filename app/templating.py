@@ -0,0 +1,61 @@
+"""Module-level Jinja environment plus a small rendered-page cache.
+
+Template lookup/compilation happens once at import (views hoist
+``templates.get_template(...)`` into module constants) instead of per
+request, and list pages that change rarely can serve fully rendered HTML
+from memory with an ETag so unchanged clients get a 304 without any
+rendering or SQL.
+"""
+
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response
+from fastapi.templating import Jinja2Templates
+from jinja2 import Template
+
+templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+
+# Rendered HTML keyed by path — the cached pages ignore query params, so
+# keying on the full URL would let arbitrary ?x=1 variants both miss the
+# cache and grow it without bound. Entries carry the mutation version they
+# were rendered at and a short expiry, so room edits invalidate instantly
+# via the version while item-level drift is bounded by the TTL; the LRU cap
+# bounds memory regardless.
+_PAGE_TTL = 60.0
+_MAX_PAGES = 64
+_pages: OrderedDict[str, tuple[float, int, str, str]] = OrderedDict()
+
+
+def render_cached(
+    request: Request, template: Template, context: dict, version: int
+) -> Response | None:
+    """Serve a cached page if fresh, else None so the caller builds `context`.
+
+    Call with ``context=None`` first to probe; on a miss, render the view
+    model and call again with the real context to populate the cache. Only
+    for pages whose output is independent of the query string.
+    """
+    path = request.url.path
+    entry = _pages.get(path)
+    now = time.monotonic()
+    if entry is not None and entry[1] == version and now < entry[0]:
+        _pages.move_to_end(path)
+        _, _, etag, html = entry
+    elif context is None:
+        if entry is not None:
+            del _pages[path]
+        return None
+    else:
+        html = template.render(**context)
+        etag = f'"{blake2b(html.encode(), digest_size=8).hexdigest()}"'
+        _pages[path] = (now + _PAGE_TTL, version, etag, html)
+        _pages.move_to_end(path)
+        while len(_pages) > _MAX_PAGES:
+            _pages.popitem(last=False)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return HTMLResponse(html, headers={"ETag": etag})
@@ -0,0 +1,522 @@
+"""Capture workflows: video, single image, rapid snaps, and live scan sessions."""
+
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import CaptureSession, Room
+from app.repositories import ItemRepository, RoomRepository
+from app.schemas import CaptureConfirmItem, DetectedObject, FrameAnalysisResult
+from app.services import iouring
+from app.services.books import BookService
+from app.services.images import ImageService
+from app.services.transcription import TranscriptionService
+from app.services.video_processor import VideoProcessor
+from app.services.vision import LocalVisionService
+
+_log = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
+_ITEM_LIST_ADAPTER = TypeAdapter(list[DetectedObject])
+
+# Batched attribute extraction for the confirm_items spec-building loop.
+_CONFIRM_GET = attrgetter(
+    "name", "description", "condition", "confidence", "estimated_value", "voice_context"
+)
+_BOOK_GET = attrgetter("isbn", "author", "publisher")
+
+
+# Next frame number per live-scan session. Seeded once from the directory so a
+# restarted process keeps numbering where it left off; afterwards each frame is
+# an O(1) counter bump instead of a Path.glob walk per frame.
+_SCAN_COUNTERS: dict[int, int] = {}
+
+
+def _utcnow() -> datetime:
+    """Single timestamp helper: timezone-aware UTC, fetched once per use site."""
+    return datetime.now(timezone.utc)
+
+
+def _write_large(path: Path, data: bytes) -> None:
+    """Write a large upload blob with the file pre-sized via posix_fallocate.
+
+    Telling the filesystem the final size up front avoids incremental extent
+    allocation while 50-500MB video blobs land, and writing straight from a
+    memoryview skips Python's buffered-I/O layer. Falls back to plain os.write
+    where fallocate is unsupported (non-Linux / some filesystems).
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, len(data))
+            except OSError:
+                pass
+        view = memoryview(data)
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+# Process-wide service singletons. The services load models or hold HTTP
+# clients, so constructing them per call re-paid initialization on every
+# request; lru_cache(maxsize=1) gives one lazily-built instance each.
+@lru_cache(maxsize=1)
+def _vision() -> LocalVisionService:
+    return LocalVisionService()
+
+
+@lru_cache(maxsize=1)
+def _transcription() -> TranscriptionService:
+    return TranscriptionService()
+
+
+@lru_cache(maxsize=1)
+def _book_service() -> BookService:
+    return BookService()
+
+
+class CaptureViewModel:
+    """Orchestrates capture sessions from raw upload bytes to confirmed items."""
+
+    @staticmethod
+    async def _transcode_to_wav(audio_data: bytes, audio_wav: Path) -> bool:
+        """Convert captured audio bytes to a 16kHz mono WAV via ffmpeg stdin.
+
+        create_subprocess_exec keeps thread-pool workers free for actual CPU work
+        and lets cancellation propagate, unlike parking a thread on
+        subprocess.run for up to the full timeout. Feeding the blob through
+        pipe:0 skips the intermediate .webm write+read (and its cleanup) that
+        previously round-tripped every narration clip through disk. stderr
+        stays as bytes and is only decoded on the failure path.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-threads", "0", "-f", "webm", "-i", "pipe:0",
+            "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+            str(audio_wav),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(audio_data), timeout=120)
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False
+        if proc.returncode != 0:
+            _log.warning("ffmpeg transcode failed: %s", stderr.decode(errors="replace")[-500:])
+            return False
+        return True
+
+    @staticmethod
+    def _build_voice_contexts(transcript, timestamps) -> dict[int, str]:
+        """Map frame index -> narration snippet; shared by all capture paths."""
+        if not (transcript and timestamps):
+            return {}
+        # correlate_all_frames yields; enumerate feeds it directly and the
+        # dict comprehension is the only pass over the correlations.
+        return {
+            c.frame_index: c.transcript_snippet
+            for c in _transcription().correlate_all_frames(transcript, enumerate(timestamps))
+            if c.transcript_snippet.strip()
+        }
+
+    @classmethod
+    async def start_session(
+        cls, session: AsyncSession, room_id: int | None, mode: str
+    ) -> CaptureSession:
+        capture = CaptureSession(room_id=room_id, mode=mode)
+        session.add(capture)
+        await session.commit()
+        return capture
+
+    @classmethod
+    async def process_video(
+        cls,
+        session: AsyncSession,
+        session_id: int,
+        video_data: bytes,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[DetectedObject]:
+        """Full video pipeline: frames -> quality filter -> transcript -> vision -> dedup."""
+        capture = await session.get(CaptureSession, session_id)
+        video_dir = settings.data_dir / "video" / str(session_id)
+        video_dir.mkdir(parents=True, exist_ok=True)
+        video_path = video_dir / "capture.webm"
+        await asyncio.get_running_loop().run_in_executor(
+            None, _write_large, video_path, video_data
+        )
+
+        processor = VideoProcessor(settings.frame_interval)
+        frames = await asyncio.to_thread(processor.extract_frames, video_path, video_dir / "frames")
+        frames = await asyncio.to_thread(processor._filter_quality_frames, frames)
+
+        transcription = _transcription()
+        transcript = await asyncio.to_thread(transcription.transcribe, video_path)
+        if transcript:
+            capture.transcript_json = orjson.dumps(transcript.model_dump()).decode()
+
+        timestamps = [ts for _, ts in frames]
+        voice_contexts = cls._build_voice_contexts(transcript, timestamps)
+
+        vision = _vision()
+        frame_results: list[FrameAnalysisResult] = []
+        for i, (frame_path, ts) in enumerate(frames):
+            objects = await vision.analyze_frame(frame_path, voice_context=voice_contexts.get(i))
+            frame_results.append(
+                FrameAnalysisResult(frame_path=str(frame_path), timestamp=ts, objects=objects)
+            )
+            if progress_callback:
+                await progress_callback(i + 1, len(frames))
+
+        deduped = processor._deduplicate_objects(frame_results)
+        capture.status = "analyzed"
+        capture.item_count = len(deduped)
+        capture.completed_at = _utcnow()
+        await session.commit()
+        return deduped
+
+    @classmethod
+    async def process_rapid_capture(
+        cls,
+        session: AsyncSession,
+        session_id: int,
+        snap_images: list[bytes],
+        audio_data: bytes | None = None,
+        snap_timestamps: list[float] | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[DetectedObject]:
+        """Burst-capture pipeline: save snaps, transcribe narration, analyze, dedup.
+
+        Snap analysis runs as an asyncio.gather pipeline bounded by a semaphore so
+        several frames are in flight against the vision backend at once; a shared
+        completion counter keeps progress callbacks monotonic as chunks finish
+        out of order.
+        """
+        capture = await session.get(CaptureSession, session_id)
+        rapid_dir = settings.data_dir / "rapid" / str(session_id)
+        rapid_dir.mkdir(parents=True, exist_ok=True)
+
+        transcription = _transcription()
+
+        async def _audio_transcript():
+            if not audio_data:
+                return None
+            audio_wav = rapid_dir / "audio.wav"
+            if await cls._transcode_to_wav(audio_data, audio_wav):
+                return await asyncio.to_thread(transcription.transcribe, audio_wav)
+            return None
+
+        # Start audio conversion before the snap writes so ffmpeg runs while the
+        # JPEGs hit disk; the writes go through iouring.write_batch (one
+        # io_uring submission for the whole burst, plain writes where
+        # unavailable) on a worker thread so hundreds of snaps never block the
+        # event loop.
+        audio_task = asyncio.create_task(_audio_transcript())
+        snap_paths = [rapid_dir / f"snap_{i:04d}.jpg" for i in range(len(snap_images))]
+        # Snaps are persisted in the background for audit/confirmation use only;
+        # analysis reads the upload bytes straight from memory, so the hot path
+        # never waits on a disk write+read pair per JPEG.
+        save_task = asyncio.create_task(
+            asyncio.to_thread(iouring.write_batch, list(zip(snap_paths, snap_images)))
+        )
+        transcript = await audio_task
+        if transcript:
+            capture.transcript_json = orjson.dumps(transcript.model_dump()).decode()
+
+        timestamps = snap_timestamps or []
+        voice_contexts = cls._build_voice_contexts(transcript, timestamps)
+
+        vision = _vision()
+        sem = asyncio.Semaphore(settings.vision_concurrency or 4)
+        done = 0
+        done_lock = asyncio.Lock()
+
+        # Micro-batch snaps into one model invocation per chunk; chunks still
+        # fly concurrently under the semaphore, amortizing per-call overhead
+        # across vision_batch_size frames.
+        batch_size = settings.vision_batch_size or 4
+        chunks = [
+            list(range(i, min(i + batch_size, len(snap_paths))))
+            for i in range(0, len(snap_paths), batch_size)
+        ]
+
+        async def _one_chunk(indices: list[int]) -> list[FrameAnalysisResult]:
+            nonlocal done
+            async with sem:
+                groups = await vision.analyze_batch(
+                    [snap_images[i] for i in indices],
+                    [voice_contexts.get(i) for i in indices],
+                    [str(snap_paths[i]) for i in indices],
+                )
+            async with done_lock:
+                done += len(indices)
+                if progress_callback:
+                    await progress_callback(done, len(snap_paths))
+            return [
+                FrameAnalysisResult(
+                    frame_path=str(snap_paths[i]),
+                    timestamp=timestamps[i] if i < len(timestamps) else 0.0,
+                    objects=objects,
+                )
+                for i, objects in zip(indices, groups)
+            ]
+
+        chunk_results = await asyncio.gather(*[_one_chunk(c) for c in chunks])
+        await save_task
+        all_results = [result for chunk in chunk_results for result in chunk]
+
+        processor = VideoProcessor()
+        deduped = processor._deduplicate_objects(all_results)
+        capture.status = "analyzed"
+        capture.item_count = len(deduped)
+        capture.completed_at = _utcnow()
+        await session.commit()
+        return deduped
+
+    @classmethod
+    async def process_image(
+        cls,
+        session: AsyncSession,
+        session_id: int,
+        image_data: bytes,
+        audio_data: bytes | None = None,
+    ) -> tuple[list[DetectedObject], dict | None]:
+        """Single-photo capture with optional narration and book barcode lookup."""
+        capture = await session.get(CaptureSession, session_id)
+        room = await session.get(Room, capture.room_id) if capture.room_id else None
+        room_name = room.name if room else "unsorted"
+
+        img_service = ImageService()
+        image_path = await asyncio.to_thread(img_service.save_upload, image_data, room_name)
+
+        # Both enrichment legs are best-effort: a transcription hiccup or a
+        # barcode/ISBN network failure must not take the vision results (and
+        # the whole capture) down with it, so each swallows and logs its own
+        # failures instead of letting them propagate through the gather.
+        async def _voice_context() -> str | None:
+            if not audio_data:
+                return None
+            try:
+                work_dir = settings.data_dir / "image" / str(session_id)
+                work_dir.mkdir(parents=True, exist_ok=True)
+                audio_wav = work_dir / "audio.wav"
+                if await cls._transcode_to_wav(audio_data, audio_wav):
+                    transcript = await asyncio.to_thread(_transcription().transcribe, audio_wav)
+                    if transcript:
+                        return transcript.text
+            except Exception:
+                _log.warning("narration transcription failed", exc_info=True)
+            return None
+
+        book_service = _book_service()
+
+        async def _book_meta() -> dict | None:
+            # Chain scan -> ISBN lookup inside one coroutine so the HTTP
+            # round-trip starts the moment the barcode decodes, fully hidden
+            # behind vision inference instead of running after it.
+            try:
+                barcode = await asyncio.to_thread(book_service.scan_barcode, image_path)
+                return await book_service.lookup_isbn(barcode) if barcode else None
+            except Exception:
+                _log.warning("book metadata lookup failed", exc_info=True)
+                return None
+
+        # Vision, the barcode/ISBN chain, and the audio pipeline are
+        # independent: vision starts as soon as the image is saved rather than
+        # waiting out ffmpeg + transcription, and narration is merged onto the
+        # detections afterwards (it only enriches text fields, it doesn't
+        # steer detection placement).
+        vision = _vision()
+        detected, book_meta, voice_context = await asyncio.gather(
+            vision.analyze_frame(image_path),
+            _book_meta(),
+            _voice_context(),
+        )
+        if voice_context:
+            for obj in detected:
+                if not obj.voice_context:
+                    obj.voice_context = voice_context
+
+        capture.status = "analyzed"
+        capture.completed_at = _utcnow()
+        await session.commit()
+        return detected, book_meta
+
+    @staticmethod
+    def _next_frame_number(session_id: int, scan_dir: Path) -> int:
+        count = _SCAN_COUNTERS.get(session_id)
+        if count is None:
+            count = sum(1 for e in os.scandir(scan_dir) if e.name.startswith("frame_"))
+        _SCAN_COUNTERS[session_id] = count + 1
+        return count
+
+    @classmethod
+    async def process_scan_frame(
+        cls, session: AsyncSession, session_id: int, frame_data: bytes
+    ) -> list[DetectedObject]:
+        """Analyze one live-scan frame, persisting it for later confirmation."""
+        scan_dir = settings.data_dir / "scan" / str(session_id)
+        scan_dir.mkdir(parents=True, exist_ok=True)
+        frame_num = cls._next_frame_number(session_id, scan_dir)
+        frame_path = scan_dir / f"frame_{frame_num:04d}.jpg"
+        await asyncio.to_thread(frame_path.write_bytes, frame_data)
+
+        vision = _vision()
+        return await vision.analyze_frame(frame_data, frame_path=str(frame_path))
+
+    @classmethod
+    async def process_scan_complete(
+        cls,
+        session: AsyncSession,
+        session_id: int,
+        items_json: list[dict],
+        audio_data: bytes | None = None,
+        timestamps: list[float] | None = None,
+    ) -> list[DetectedObject]:
+        """Finish a live scan: rebuild detections, correlate narration, dedup."""
+        capture = await session.get(CaptureSession, session_id)
+        scan_dir = settings.data_dir / "scan" / str(session_id)
+        scan_dir.mkdir(parents=True, exist_ok=True)
+
+        transcription = _transcription()
+        transcript = None
+        if audio_data:
+            audio_wav = scan_dir / "audio.wav"
+            if await cls._transcode_to_wav(audio_data, audio_wav):
+                transcript = await asyncio.to_thread(transcription.transcribe, audio_wav)
+            if transcript:
+                capture.transcript_json = orjson.dumps(transcript.model_dump()).decode()
+
+        # Batch validation dispatches once into pydantic-core instead of paying
+        # per-item Python-level DetectedObject(**d) construction.
+        all_objects = _ITEM_LIST_ADAPTER.validate_python(items_json)
+
+        # Single traversal: frame_path was validated onto each object, so there
+        # is no need for a second pass zipping items_json against all_objects.
+        frame_groups: defaultdict[str, list[DetectedObject]] = defaultdict(list)
+        for obj in all_objects:
+            frame_groups[obj.frame_path].append(obj)
+
+        timestamps = timestamps or []
+        voice_contexts = cls._build_voice_contexts(transcript, timestamps)
+
+        frame_results: list[FrameAnalysisResult] = []
+        ts_len = len(timestamps)
+        for i, (frame_path, objects) in enumerate(frame_groups.items()):
+            vc = voice_contexts.get(i)
+            if vc:  # skip the inner walk entirely in the common video-only case
+                for obj in objects:
+                    if not obj.voice_context:
+                        obj.voice_context = vc
+            frame_results.append(
+                FrameAnalysisResult(
+                    frame_path=frame_path,
+                    timestamp=timestamps[i] if i < ts_len else 0.0,
+                    objects=objects,
+                )
+            )
+
+        processor = VideoProcessor()
+        deduped = processor._deduplicate_objects(frame_results)
+        capture.status = "analyzed"
+        capture.item_count = len(deduped)
+        capture.completed_at = _utcnow()
+        await session.commit()
+        return deduped
+
+    @classmethod
+    async def confirm_items(
+        cls,
+        session: AsyncSession,
+        session_id: int,
+        room_id: int,
+        items: list[CaptureConfirmItem],
+    ) -> list:
+        """Persist the detections the user kept, copying frames into the room album."""
+        item_repo = ItemRepository(session)
+        # Only the name is needed (for the album directory); a scalar select
+        # skips hydrating the Room row and its relationship machinery.
+        room_name = await RoomRepository(session).get_name(room_id) or "unsorted"
+        img_service = ImageService()
+
+        # One scandir per unique capture directory replaces a stat syscall per
+        # item: confirmations reference at most a handful of scan/rapid dirs.
+        parents = {str(Path(ci.frame_path).parent) for ci in items if ci.frame_path}
+        existing_files: set[str] = set()
+        for parent in parents:
+            try:
+                existing_files.update(os.path.join(parent, e.name) for e in os.scandir(parent))
+            except FileNotFoundError:
+                continue
+
+        # Phase 1: persist frame images in parallel on the thread pool — the
+        # copy + thumbnail is the slow, CPU/disk-bound part. Several confirmed
+        # detections usually come off the same frame, so each unique frame is
+        # saved exactly once and siblings share the result.
+        unique_frames = [
+            fp
+            for fp in dict.fromkeys(ci.frame_path for ci in items if ci.frame_path)
+            if fp in existing_files
+        ]
+        saved = await asyncio.gather(
+            *[
+                asyncio.to_thread(img_service.save_image, Path(fp), room_name)
+                for fp in unique_frames
+            ]
+        )
+        frame_to_saved = dict(zip(unique_frames, saved))
+        saved_paths = [frame_to_saved.get(ci.frame_path) for ci in items]
+
+        # Phase 2 builds everything in memory, then lands each kind with a
+        # single bulk INSERT .. RETURNING — two statements total and one
+        # commit, instead of an ORM flush round-trip per confirmed detection.
+        # The per-call constants live in one template dict merged into each
+        # spec, and attrgetter pulls the shared fields in a single C-level
+        # call rather than seven attribute lookups per item.
+        static = {"room_id": room_id, "source_type": "capture", "source_session_id": session_id}
+        book_static = static | {"category": "books"}
+        book_specs: list[dict] = []
+        item_specs: list[dict] = []
+        for ci, image_path in zip(items, saved_paths):
+            name, description, condition, confidence, estimated_value, vc = _CONFIRM_GET(ci)
+            dyn = {
+                "name": name,
+                "description": description or None,
+                "condition": condition,
+                "confidence_score": confidence,
+                "estimated_value": estimated_value,
+                "voice_context": vc,
+                "image_path": str(image_path) if image_path else None,
+            }
+            if ci.is_book:
+                isbn, author, publisher = _BOOK_GET(ci)
+                book_specs.append(
+                    book_static | dyn | {"isbn": isbn, "author": author, "publisher": publisher}
+                )
+            else:
+                item_specs.append(static | dyn | {"category": ci.category})
+
+        books = await item_repo.bulk_create_books(book_specs)
+        created = books + await item_repo.bulk_create(item_specs)
+
+        capture = await session.get(CaptureSession, session_id)
+        if capture:
+            capture.status = "confirmed"
+        await session.commit()
+        return created
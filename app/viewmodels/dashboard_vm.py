@@ -0,0 +1,73 @@
+"""Dashboard: headline stats, category breakdown, and recent activity."""
+
+import asyncio
+
+from app.db import session_scope
+from app.models import Item, Room
+from app.repositories import ItemRepository, RoomRepository
+
+LOW_CONFIDENCE = 0.7
+
+
+class DashboardViewModel:
+    def __init__(
+        self,
+        rooms: list[Room],
+        stats: dict,
+        by_category: dict[str, dict],
+        recent: list[Item],
+        needs_attention: list[Item],
+    ):
+        self.rooms = rooms
+        self.stats = stats
+        self.by_category = by_category
+        self.recent = recent
+        self.needs_attention = needs_attention
+
+    @classmethod
+    async def load(cls) -> "DashboardViewModel":
+        """Run the five independent dashboard queries concurrently.
+
+        Each coroutine opens its own short-lived session (an AsyncSession
+        cannot multiplex statements), so render time is the slowest query
+        rather than the sum of all five round-trips.
+        """
+
+        async def _rooms() -> list[Room]:
+            async with session_scope() as s:
+                return await RoomRepository(s).get_all()
+
+        async def _stats() -> dict:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_stats()
+
+        async def _by_category() -> list[tuple]:
+            async with session_scope() as s:
+                return await ItemRepository(s).aggregate_by_category()
+
+        async def _recent() -> list[Item]:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_recent(limit=8)
+
+        async def _attention() -> list[Item]:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_low_confidence(
+                    limit=8, threshold=LOW_CONFIDENCE
+                )
+
+        rooms, stats, category_rows, recent, needs_attention = await asyncio.gather(
+            _rooms(), _stats(), _by_category(), _recent(), _attention()
+        )
+        # Category counts and values arrive pre-grouped from SQL rather than
+        # being summed over hydrated items here.
+        by_category = {
+            category: {"count": count, "value": float(value)}
+            for category, count, value in category_rows
+        }
+        return cls(
+            rooms=rooms,
+            stats=stats,
+            by_category=by_category,
+            recent=recent,
+            needs_attention=needs_attention,
+        )
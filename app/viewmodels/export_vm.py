@@ -0,0 +1,54 @@
+"""Export page: pick rooms, download the inventory as CSV or JSON."""
+
+import asyncio
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import session_scope
+from app.models import Item, Room
+from app.repositories import ItemRepository, RoomRepository
+from app.services.export import ExportService
+
+
+class ExportViewModel:
+    def __init__(self, rooms: list[Room], stats: dict):
+        self.rooms = rooms
+        self.stats = stats
+
+    @classmethod
+    async def load(cls) -> "ExportViewModel":
+        """Fetch rooms and stats concurrently, one short-lived session each."""
+
+        async def _rooms() -> list[Room]:
+            async with session_scope() as s:
+                return await RoomRepository(s).get_all()
+
+        async def _stats() -> dict:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_stats()
+
+        rooms, stats = await asyncio.gather(_rooms(), _stats())
+        return cls(rooms=rooms, stats=stats)
+
+    @staticmethod
+    async def _items_with_rooms(
+        session: AsyncSession, room_ids: list[int] | None
+    ) -> AsyncIterator[tuple[Item, str | None]]:
+        """Stream filtered items paired with their room name.
+
+        Room names come from the TTL-cached id -> name map, so repeated
+        exports don't re-query the room table; items flow straight off the
+        repository's streaming cursor.
+        """
+        room_names = await RoomRepository(session).get_name_map()
+        async for item in ItemRepository(session).iter_filtered(room_ids=room_ids):
+            yield item, room_names.get(item.room_id)
+
+    @classmethod
+    async def generate_csv(cls, session: AsyncSession, room_ids: list[int] | None = None) -> str:
+        return await ExportService().to_csv(cls._items_with_rooms(session, room_ids))
+
+    @classmethod
+    async def generate_json(cls, session: AsyncSession, room_ids: list[int] | None = None) -> bytes:
+        return await ExportService().to_json(cls._items_with_rooms(session, room_ids))
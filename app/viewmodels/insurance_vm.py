@@ -0,0 +1,95 @@
+"""Insurance report: per-room and per-category value rollups for a claim."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import session_scope
+from app.models import Item
+from app.repositories import ItemRepository, RoomRepository
+
+HIGH_VALUE_THRESHOLD = 500.0
+
+
+def _item_value(item: Item) -> float:
+    return item.replacement_cost or item.estimated_value or 0.0
+
+
+class InsuranceViewModel:
+    def __init__(
+        self,
+        items: list[dict],
+        total_value: float,
+        room_totals: dict[str, float],
+        category_totals: dict[str, float],
+        high_value: list[dict],
+    ):
+        self.items = items
+        self.total_value = total_value
+        self.room_totals = room_totals
+        self.category_totals = category_totals
+        self.high_value = high_value
+
+    @classmethod
+    async def load(
+        cls, session: AsyncSession, room_ids: list[int] | None = None
+    ) -> "InsuranceViewModel":
+        """Build the report from a streamed, SQL-filtered item scan.
+
+        Items come off a server-side cursor with the room filter pushed into
+        WHERE, so only rows in the report are ever hydrated; each row is
+        reduced to a small summary dict as it streams past.
+        """
+        # The three small queries are independent; each runs on its own
+        # short-lived session so they overlap instead of queueing on the
+        # request session. Only the item stream below uses the caller's.
+        async def _room_names() -> dict[int, str]:
+            async with session_scope() as s:
+                return await RoomRepository(s).get_name_map()
+
+        async def _room_aggs() -> list[tuple]:
+            async with session_scope() as s:
+                return await ItemRepository(s).aggregate_by_room(room_ids=room_ids)
+
+        async def _category_aggs() -> list[tuple]:
+            async with session_scope() as s:
+                return await ItemRepository(s).aggregate_by_category(room_ids=room_ids)
+
+        room_names, room_aggs, category_aggs = await asyncio.gather(
+            _room_names(), _room_aggs(), _category_aggs()
+        )
+        item_repo = ItemRepository(session)
+        # The grouped totals come straight from GROUP BY — O(groups) rows over
+        # the wire instead of summing floats in Python — and total value is
+        # their sum. The streaming pass below only does what SQL can't: build
+        # the per-item summary rows and flag the high-value ones.
+        room_totals = {
+            room_names.get(room_id, "Unassigned"): float(value)
+            for room_id, _, value in room_aggs
+        }
+        category_totals = {category: float(value) for category, _, value in category_aggs}
+        total_value = sum(category_totals.values())
+
+        summaries: list[dict] = []
+        high_value: list[dict] = []
+        threshold = HIGH_VALUE_THRESHOLD
+        get_room = room_names.get
+        async for item in item_repo.iter_filtered(room_ids=room_ids):
+            summary = {
+                "name": item.name,
+                "category": item.category,
+                "room": get_room(item.room_id, "Unassigned"),
+                "value": _item_value(item),
+                "serial_number": item.serial_number,
+                "condition": item.condition,
+            }
+            summaries.append(summary)
+            if summary["value"] >= threshold:
+                high_value.append(summary)
+        return cls(
+            items=summaries,
+            total_value=total_value,
+            room_totals=room_totals,
+            category_totals=category_totals,
+            high_value=high_value,
+        )
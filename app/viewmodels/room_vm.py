@@ -0,0 +1,103 @@
+"""Room pages: list with totals, detail with items and stats, and mutations."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import session_scope
+from app.models import Room
+from app.repositories import ItemRepository, RoomRepository, bump_rooms_version
+
+
+class RoomListViewModel:
+    def __init__(
+        self, rooms: list[Room], counts: dict[int, int], totals: dict[int, float]
+    ):
+        self.rooms = rooms
+        self.counts = counts
+        self.totals = totals
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> "RoomListViewModel":
+        """Room list with per-room counts and value totals from one GROUP BY.
+
+        The list page only renders aggregates, so there is no reason to
+        hydrate every item just to len() and sum() them in Python; the rooms
+        query and the stats query run concurrently, the latter on its own
+        short-lived session.
+        """
+
+        async def _stats() -> dict[int, tuple[int, float]]:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_room_stats_all()
+
+        rooms, stats = await asyncio.gather(
+            RoomRepository(session).get_all(), _stats()
+        )
+        counts = {room.id: stats.get(room.id, (0, 0.0))[0] for room in rooms}
+        totals = {room.id: stats.get(room.id, (0, 0.0))[1] for room in rooms}
+        return cls(rooms=rooms, counts=counts, totals=totals)
+
+
+class RoomDetailViewModel:
+    def __init__(self, room: Room, items: list, item_count: int, total_value: float):
+        self.room = room
+        self.items = items
+        self.item_count = item_count
+        self.total_value = total_value
+
+    @classmethod
+    async def load(cls, room_id: int) -> "RoomDetailViewModel | None":
+        """One selectin query for the room + items, one aggregate for the stats.
+
+        The two queries are independent, so each runs on its own short-lived
+        session under asyncio.gather; items come from the already-loaded
+        relationship instead of a separate get_by_room fetch, and the count
+        and value sum arrive pre-computed from SQL.
+        """
+
+        async def _room() -> Room | None:
+            async with session_scope() as s:
+                return await RoomRepository(s).get_with_items(room_id)
+
+        async def _stats() -> tuple[int, float]:
+            async with session_scope() as s:
+                return await ItemRepository(s).get_room_stats(room_id)
+
+        room, (item_count, total_value) = await asyncio.gather(_room(), _stats())
+        if room is None:
+            return None
+        return cls(
+            room=room, items=list(room.items), item_count=item_count, total_value=total_value
+        )
+
+    @classmethod
+    async def create_room(
+        cls, session: AsyncSession, name: str, description: str | None = None
+    ) -> Room:
+        room = await RoomRepository(session).create(name, description)
+        await session.commit()
+        return room
+
+    @classmethod
+    async def update_room(
+        cls, session: AsyncSession, room_id: int, updates: dict
+    ) -> Room | None:
+        room = await RoomRepository(session).get(room_id)
+        if room is None:
+            return None
+        for key, value in updates.items():
+            setattr(room, key, value)
+        await session.commit()
+        bump_rooms_version()
+        return room
+
+    @classmethod
+    async def delete_room(cls, session: AsyncSession, room_id: int) -> bool:
+        room = await RoomRepository(session).get(room_id)
+        if room is None:
+            return False
+        await session.delete(room)
+        await session.commit()
+        bump_rooms_version()
+        return True
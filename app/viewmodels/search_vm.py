@@ -0,0 +1,90 @@
+"""Search page: filtered, paginated item lookup across the inventory."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import session_scope
+from app.models import Item, Room
+from app.repositories import ItemRepository, RoomRepository
+
+PAGE_SIZE = 50
+
+
+class SearchViewModel:
+    def __init__(
+        self,
+        rooms: list[Room],
+        results: list[Item],
+        total_results: int,
+        query: str = "",
+        room_id: int | None = None,
+        category: str | None = None,
+        page: int = 1,
+        page_size: int = PAGE_SIZE,
+    ):
+        self.rooms = rooms
+        self.results = results
+        self.total_results = total_results
+        self.query = query
+        self.room_id = room_id
+        self.category = category
+        self.page = page
+        self.page_size = page_size
+        self.total_pages = max(1, -(-total_results // page_size))
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> "SearchViewModel":
+        rooms = await RoomRepository(session).get_all_cached()
+        return cls(rooms=rooms, results=[], total_results=0)
+
+    @classmethod
+    async def search(
+        cls,
+        session: AsyncSession,
+        query: str,
+        room_id: int | None = None,
+        category: str | None = None,
+        page: int = 1,
+        page_size: int = PAGE_SIZE,
+    ) -> "SearchViewModel":
+        # The dropdown rooms and the result page are independent; the rooms
+        # side is usually a version-cache hit and otherwise runs its query on
+        # its own short-lived session so both round-trips overlap (one
+        # AsyncSession cannot multiplex).
+        async def _rooms() -> list[Room]:
+            async with session_scope() as s:
+                return await RoomRepository(s).get_all_cached()
+
+        rooms, (results, total_results) = await asyncio.gather(
+            _rooms(),
+            ItemRepository(session).search(
+                query,
+                room_id=room_id,
+                category=category,
+                limit=page_size,
+                offset=(page - 1) * page_size,
+            ),
+        )
+        if not results and total_results:
+            # The requested page starts past the last match — a stale link
+            # after deletions or a hand-edited ?page=. Clamp to the real last
+            # page and refetch rather than rendering "0 results".
+            page = max(1, -(-total_results // page_size))
+            results, total_results = await ItemRepository(session).search(
+                query,
+                room_id=room_id,
+                category=category,
+                limit=page_size,
+                offset=(page - 1) * page_size,
+            )
+        return cls(
+            rooms=rooms,
+            results=results,
+            total_results=total_results,
+            query=query,
+            room_id=room_id,
+            category=category,
+            page=page,
+            page_size=page_size,
+        )
@@ -0,0 +1,133 @@
+"""Room CRUD pages."""
+
+from urllib.parse import parse_qsl
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import RedirectResponse, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session
+from app.repositories import ItemRepository, rooms_version
+from app.schemas import RoomUpdate
+from app.templating import render_cached, templates
+from app.viewmodels.room_vm import RoomDetailViewModel, RoomListViewModel
+
+router = APIRouter(prefix="/rooms", tags=["rooms"])
+
+# Room forms are a couple of short text fields; anything past this is either a
+# broken client or an attempt to make us pre-allocate per the header below.
+MAX_FORM_BYTES = 64 * 1024
+
+
+async def read_form_sized(request: Request) -> dict[str, str]:
+    """Parse a urlencoded form from a buffer pre-sized via Content-Length.
+
+    request.form() grows its body buffer by repeated appends; allocating the
+    full size once and slicing chunks in means a single allocation per body.
+    Both the declared size and the bytes actually received are client-
+    controlled, so each is bounded by MAX_FORM_BYTES (413 past that) — a
+    chunked request without Content-Length just starts from an empty buffer
+    and grows under the same cap. Multipart bodies (file uploads) still go
+    through request.form().
+    """
+    if "multipart/form-data" in request.headers.get("content-type", ""):
+        return {k: v for k, v in (await request.form()).items() if isinstance(v, str)}
+    length = request.headers.get("content-length", "")
+    size = int(length) if length.isdigit() else 0
+    if size > MAX_FORM_BYTES:
+        raise HTTPException(status_code=413, detail="Form body too large")
+    buf = bytearray(size)
+    pos = 0
+    async for chunk in request.stream():
+        if pos + len(chunk) > MAX_FORM_BYTES:
+            raise HTTPException(status_code=413, detail="Form body too large")
+        buf[pos : pos + len(chunk)] = chunk
+        pos += len(chunk)
+    return dict(parse_qsl(bytes(buf[:pos]).decode(), keep_blank_values=True))
+
+# Looked up and compiled once at import, not per request.
+_LIST_TEMPLATE = templates.get_template("rooms/list.html")
+_DETAIL_TEMPLATE = templates.get_template("rooms/detail.html")
+_ROW_TEMPLATE = templates.get_template("rooms/_row.html")
+
+
+def _row_response(request: Request, room, **context) -> Response | None:
+    """Row partial for HTMX mutations, rendered from the in-memory Room.
+
+    The full-page redirect costs a re-GET plus a complete list re-render for
+    a one-row change; HTMX callers instead get just the mutated row (no DB
+    re-read) and an HX-Trigger so listeners can refresh derived counts.
+    """
+    if not request.headers.get("hx-request"):
+        return None
+    return Response(
+        _ROW_TEMPLATE.render(room=room, **context),
+        media_type="text/html",
+        headers={"HX-Trigger": "roomsChanged"},
+    )
+
+
+@router.get("/")
+async def list_rooms(request: Request, session: AsyncSession = Depends(get_session)):
+    cached = render_cached(request, _LIST_TEMPLATE, None, rooms_version())
+    if cached is not None:
+        return cached
+    vm = await RoomListViewModel.load(session)
+    return render_cached(request, _LIST_TEMPLATE, {"vm": vm}, rooms_version())
+
+
+@router.get("/{room_id}")
+async def room_detail(room_id: int):
+    vm = await RoomDetailViewModel.load(room_id)
+    if vm is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+    return Response(_DETAIL_TEMPLATE.render(vm=vm), media_type="text/html")
+
+
+@router.post("/")
+async def create_room(request: Request, session: AsyncSession = Depends(get_session)):
+    form = await read_form_sized(request)
+    name = (form.get("name") or "").strip()
+    if not name:
+        raise HTTPException(status_code=422, detail="Room name is required")
+    room = await RoomDetailViewModel.create_room(
+        session, name=name, description=form.get("description") or None
+    )
+    # A new room has no items yet, so the row renders without touching the DB.
+    partial = _row_response(request, room, item_count=0, total_value=0)
+    if partial is not None:
+        return partial
+    return RedirectResponse(f"/rooms/{room.id}", status_code=303)
+
+
+@router.put("/{room_id}")
+async def update_room(
+    request: Request, room_id: int, session: AsyncSession = Depends(get_session)
+):
+    form = await read_form_sized(request)
+    # Drop only blank fields — a truthiness filter would also discard values
+    # like "0" that the user typed deliberately.
+    fields = {k: v for k, v in form.items() if v not in ("", None)}
+    if not fields:
+        # Nothing to change: skip the fetch/commit round-trip entirely.
+        return Response(status_code=304)
+    update = RoomUpdate.model_validate(fields)
+    room = await RoomDetailViewModel.update_room(
+        session, room_id, update.model_dump(exclude_none=True)
+    )
+    if room is None:
+        raise HTTPException(status_code=404, detail="Room not found")
+    if request.headers.get("hx-request"):
+        # Name/description edits don't change the stats, but the row shows
+        # them; one indexed scalar query is still far cheaper than the
+        # redirect's full list re-render.
+        count, total = await ItemRepository(session).get_room_stats(room.id)
+        return _row_response(request, room, item_count=count, total_value=total)
+    return RedirectResponse(f"/rooms/{room.id}", status_code=303)
+
+
+@router.delete("/{room_id}")
+async def delete_room(room_id: int, session: AsyncSession = Depends(get_session)):
+    if not await RoomDetailViewModel.delete_room(session, room_id):
+        raise HTTPException(status_code=404, detail="Room not found")
+    return Response(status_code=204)
@@ -0,0 +1,46 @@
+"""Search pages: the form and its HTMX-refreshed results fragment."""
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_session
+from app.repositories import rooms_version
+from app.templating import render_cached, templates
+from app.viewmodels.search_vm import PAGE_SIZE, SearchViewModel
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+# Looked up and compiled once at import, not per request.
+_INDEX_TEMPLATE = templates.get_template("search/index.html")
+_RESULTS_TEMPLATE = templates.get_template("search/results.html")
+
+
+@router.get("/")
+async def search_page(request: Request, session: AsyncSession = Depends(get_session)):
+    # The form page only depends on the rooms dropdown, so it caches cleanly
+    # against the room version.
+    cached = render_cached(request, _INDEX_TEMPLATE, None, rooms_version())
+    if cached is not None:
+        return cached
+    vm = await SearchViewModel.load(session)
+    return render_cached(request, _INDEX_TEMPLATE, {"vm": vm}, rooms_version())
+
+
+@router.get("/results")
+async def search_results(
+    request: Request,
+    q: str = "",
+    room_id: int | None = None,
+    category: str | None = None,
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=PAGE_SIZE, ge=1, le=200),
+    session: AsyncSession = Depends(get_session),
+):
+    vm = await SearchViewModel.search(
+        session, q, room_id=room_id, category=category, page=page, page_size=page_size
+    )
+    # Template.generate yields rendered chunks as Jinja produces them, so the
+    # first bytes hit the socket before the last row renders and the full
+    # page string is never assembled in memory.
+    return StreamingResponse(_RESULTS_TEMPLATE.generate(vm=vm), media_type="text/html")
@@ -0,0 +1,12 @@
+"""Gunicorn worker pinned to uvicorn's C hot path.
+
+"auto" would pick these up when the wheels are installed, but pinning
+makes a missing uvloop/httptools a startup error instead of a silent
+fallback to the pure-Python h11 parser and default event loop.
+"""
+
+from uvicorn.workers import UvicornWorker
+
+
+class FastUvicornWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
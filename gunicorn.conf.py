@@ -0,0 +1,16 @@
+"""Gunicorn config for production serving.
+
+The worker pins uvicorn to its C hot path: httptools parses request
+heads instead of the pure-Python h11 fallback, and uvloop replaces the
+default asyncio event loop. Both strip per-request Python overhead on
+the simple GET endpoints (rooms list, search) where header parsing and
+loop scheduling dominate over DB time.
+"""
+
+import multiprocessing
+
+wsgi_app = "app.main:app"
+bind = "0.0.0.0:8000"
+workers = min(multiprocessing.cpu_count(), 4)
+worker_class = "app.worker.FastUvicornWorker"
+keepalive = 5
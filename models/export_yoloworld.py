@@ -0,0 +1,6 @@
+"""Export YOLO-World to ONNX in place; shared logic lives in app.ml."""
+
+from app.ml.yoloworld_export import HOUSEHOLD_VOCABULARY, MODEL_NAME, do_export  # noqa: F401
+
+if __name__ == "__main__":
+    print(do_export())
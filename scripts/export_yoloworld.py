@@ -0,0 +1,10 @@
+"""Export YOLO-World into the app's model cache; shared logic lives in app.ml."""
+
+from pathlib import Path
+
+from app.ml.yoloworld_export import HOUSEHOLD_VOCABULARY, MODEL_NAME, do_export  # noqa: F401
+
+CACHE_DIR = Path("data") / "models"
+
+if __name__ == "__main__":
+    print(do_export(CACHE_DIR / "yoloworld_v2s.onnx"))
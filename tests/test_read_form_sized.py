@@ -0,0 +1,70 @@
+"""Tests for the pre-sized form reader and its byte caps."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.views.rooms import MAX_FORM_BYTES, read_form_sized
+
+
+def _request(chunks: list[bytes], headers: dict[str, str] | None = None) -> Request:
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/rooms/",
+        "query_string": b"",
+        "headers": [
+            (k.lower().encode(), v.encode()) for k, v in (headers or {}).items()
+        ],
+    }
+    return Request(scope, receive)
+
+
+def _read(chunks, headers=None):
+    return asyncio.run(read_form_sized(_request(chunks, headers)))
+
+
+def test_parses_urlencoded_body_with_declared_length():
+    body = b"name=Kitchen&description="
+    form = _read([body], {"content-length": str(len(body))})
+    assert form == {"name": "Kitchen", "description": ""}
+
+
+def test_parses_chunked_body_without_content_length():
+    form = _read([b"name=Kit", b"chen"])
+    assert form == {"name": "Kitchen"}
+
+
+def test_rejects_oversized_declared_length_before_reading():
+    with pytest.raises(HTTPException) as exc:
+        _read([b""], {"content-length": str(MAX_FORM_BYTES + 1)})
+    assert exc.value.status_code == 413
+
+
+def test_rejects_oversized_body_without_content_length():
+    with pytest.raises(HTTPException) as exc:
+        _read([b"x" * (MAX_FORM_BYTES + 1)])
+    assert exc.value.status_code == 413
+
+
+def test_rejects_body_streaming_past_a_small_declared_length():
+    # A client may declare little and stream a lot; the cap applies to the
+    # bytes actually received, not the header.
+    with pytest.raises(HTTPException) as exc:
+        _read([b"x" * (MAX_FORM_BYTES + 1)], {"content-length": "5"})
+    assert exc.value.status_code == 413
+
+
+def test_body_slightly_past_declared_length_still_parses():
+    form = _read([b"name=Kitchen"], {"content-length": "4"})
+    assert form == {"name": "Kitchen"}
@@ -0,0 +1,75 @@
+"""Tests for the rendered-page cache."""
+
+import pytest
+from jinja2 import Template
+from starlette.requests import Request
+
+from app import templating
+from app.templating import render_cached
+
+_TEMPLATE = Template("version {{ n }}")
+
+
+def _request(path="/rooms/", query="", headers=()):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    }
+    return Request(scope)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    templating._pages.clear()
+    yield
+    templating._pages.clear()
+
+
+def test_probe_misses_then_populates():
+    assert render_cached(_request(), _TEMPLATE, None, version=1) is None
+    populated = render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)
+    assert populated.body == b"version 1"
+    hit = render_cached(_request(), _TEMPLATE, None, version=1)
+    assert hit is not None and hit.body == b"version 1"
+
+
+def test_version_bump_invalidates():
+    render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)
+    assert render_cached(_request(), _TEMPLATE, None, version=2) is None
+    assert render_cached(_request(), _TEMPLATE, {"n": 2}, version=2).body == b"version 2"
+
+
+def test_query_string_does_not_fragment_the_cache():
+    render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)
+    for i in range(5):
+        hit = render_cached(_request(query=f"x={i}"), _TEMPLATE, None, version=1)
+        assert hit is not None
+    assert len(templating._pages) == 1
+
+
+def test_matching_etag_returns_304():
+    populated = render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)
+    etag = populated.headers["ETag"]
+    resp = render_cached(
+        _request(headers=[("if-none-match", etag)]), _TEMPLATE, None, version=1
+    )
+    assert resp.status_code == 304
+
+
+def test_expired_entries_are_dropped_on_probe(monkeypatch):
+    render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)
+    monkeypatch.setattr(templating, "_PAGE_TTL", -1.0)
+    render_cached(_request(), _TEMPLATE, {"n": 1}, version=1)  # re-populate, expired
+    assert render_cached(_request(), _TEMPLATE, None, version=1) is None
+    assert "/rooms/" not in templating._pages
+
+
+def test_lru_cap_bounds_entries(monkeypatch):
+    monkeypatch.setattr(templating, "_MAX_PAGES", 2)
+    for i in range(4):
+        render_cached(_request(path=f"/p{i}"), _TEMPLATE, {"n": i}, version=1)
+    assert len(templating._pages) == 2
+    assert "/p0" not in templating._pages and "/p3" in templating._pages
@@ -0,0 +1,50 @@
+"""Tests for the dedup clustering kernels in pure-Python form."""
+
+import numpy as np
+
+from app.services.video_processor import _cluster_labels_py, _pairwise_iou_np
+
+
+class TestClusterLabels:
+    def test_no_duplicates_is_identity(self):
+        dup = np.zeros((4, 4), dtype=np.bool_)
+        assert _cluster_labels_py(dup).tolist() == [0, 1, 2, 3]
+
+    def test_transitive_chain_collapses_to_one_root(self):
+        # 0~1 and 1~2 but never 0~2 directly; union-find must still group them.
+        dup = np.zeros((3, 3), dtype=np.bool_)
+        dup[0, 1] = dup[1, 2] = True
+        assert _cluster_labels_py(dup).tolist() == [0, 0, 0]
+
+    def test_separate_clusters_keep_distinct_roots(self):
+        dup = np.zeros((5, 5), dtype=np.bool_)
+        dup[0, 1] = True
+        dup[2, 3] = True
+        labels = _cluster_labels_py(dup)
+        assert labels[0] == labels[1]
+        assert labels[2] == labels[3]
+        assert len({labels[0], labels[2], labels[4]}) == 3
+
+
+class TestPairwiseIoU:
+    def test_identical_boxes_score_one(self):
+        boxes = np.array([[0.1, 0.1, 0.5, 0.5]] * 2, dtype=np.float32)
+        iou = _pairwise_iou_np(boxes)
+        assert iou[0, 1] == 1.0
+
+    def test_disjoint_boxes_score_zero(self):
+        boxes = np.array(
+            [[0.0, 0.0, 0.2, 0.2], [0.5, 0.5, 0.9, 0.9]], dtype=np.float32
+        )
+        assert _pairwise_iou_np(boxes)[0, 1] == 0.0
+
+    def test_half_overlap(self):
+        boxes = np.array(
+            [[0.0, 0.0, 0.2, 0.2], [0.1, 0.0, 0.3, 0.2]], dtype=np.float32
+        )
+        # intersection 0.1x0.2, union 2*0.04 - 0.02 -> IoU = 1/3
+        assert abs(_pairwise_iou_np(boxes)[0, 1] - 1 / 3) < 1e-6
+
+    def test_zero_area_boxes_do_not_divide_by_zero(self):
+        boxes = np.zeros((2, 4), dtype=np.float32)
+        assert _pairwise_iou_np(boxes)[0, 1] == 0.0
@@ -0,0 +1,73 @@
+"""Tests for the streaming JSON array parser and the frame-analysis cache."""
+
+from app.schemas import DetectedObject
+from app.services.vision import _AnalysisCache, _JSONArrayStream
+
+
+def _objects(parser, chunks):
+    out = []
+    for chunk in chunks:
+        out.extend(parser.feed(chunk))
+    return out
+
+
+class TestJSONArrayStream:
+    def test_whole_array_in_one_chunk(self):
+        raw = _objects(_JSONArrayStream(), ['[{"name": "lamp"}, {"name": "desk"}]'])
+        assert raw == ['{"name": "lamp"}', '{"name": "desk"}']
+
+    def test_object_split_across_chunks(self):
+        parser = _JSONArrayStream()
+        assert parser.feed('[{"name": "la') == []
+        assert parser.feed('mp"}') == ['{"name": "lamp"}']
+
+    def test_nested_object_emitted_whole(self):
+        raw = _objects(_JSONArrayStream(), ['[{"a": {"b": 1}}]'])
+        assert raw == ['{"a": {"b": 1}}']
+
+    def test_braces_inside_strings_are_ignored(self):
+        raw = _objects(_JSONArrayStream(), ['[{"name": "}{ bracket lamp {"}]'])
+        assert raw == ['{"name": "}{ bracket lamp {"}']
+
+    def test_escaped_quote_does_not_end_string(self):
+        raw = _objects(_JSONArrayStream(), ['[{"name": "12\\" TV}"}]'])
+        assert raw == ['{"name": "12\\" TV}"}']
+
+    def test_markdown_fences_and_commas_outside_objects_ignored(self):
+        raw = _objects(_JSONArrayStream(), ["```json\n[", '{"a": 1}', ",", '{"b": 2}', "]\n```"])
+        assert raw == ['{"a": 1}', '{"b": 2}']
+
+    def test_empty_array_yields_nothing(self):
+        assert _objects(_JSONArrayStream(), ["[]"]) == []
+
+
+class TestAnalysisCache:
+    def _detections(self, name="lamp"):
+        return [DetectedObject(name=name)]
+
+    def test_exact_hit_requires_same_narration(self):
+        cache = _AnalysisCache()
+        objects = self._detections()
+        cache.put(b"digest", None, "on the shelf", objects)
+        assert cache.get_exact(b"digest", "on the shelf") == objects
+        assert cache.get_exact(b"digest", None) is None
+        assert cache.get_exact(b"other", "on the shelf") is None
+
+    def test_phash_hit_within_hamming_tolerance(self):
+        cache = _AnalysisCache()
+        objects = self._detections()
+        cache.put(b"digest", 0b1111, None, objects)
+        assert cache.get(0b1110, None) == objects  # 1 bit off
+        assert cache.get(0b1111 ^ 0b11111, None) is None  # 5 bits off
+        assert cache.get(0b1110, "different narration") is None
+
+    def test_eviction_drops_least_recent(self):
+        cache = _AnalysisCache()
+        cache.MAX_ENTRIES = 2
+        cache.put(b"a", 1, None, self._detections("a"))
+        cache.put(b"b", 2, None, self._detections("b"))
+        cache.get_exact(b"a", None)  # refresh a so b is the eviction victim
+        cache.put(b"c", 3, None, self._detections("c"))
+        assert cache.get_exact(b"a", None) is not None
+        assert cache.get_exact(b"b", None) is None
+        assert cache.get_exact(b"c", None) is not None